@@ -6,10 +6,18 @@ import logging
 import os
 import subprocess
 from http import HTTPStatus
-from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple, Union
 
 from ..auth import Authenticator, TOKEN_ENV
-from ..config import ConfigData, ConfigError, ConfigStore, PersistenceError, ValidationError
+from ..config import (
+    DEFAULT_SCHEMA_PATH,
+    ConfigData,
+    ConfigError,
+    ConfigStore,
+    PersistenceError,
+    ValidationError,
+)
 from ..resources import get_resource_path
 from ..schedule import (
     DEFAULT_SCHEDULE_PATH,
@@ -18,18 +26,70 @@ from ..schedule import (
     ScheduleValidationError,
 )
 from ..scheduler.watch import resolve_default_updater_command
-from ..ui.logs import LogReadError, gather_logs
+from ..ui.logs import (
+    MAX_UI_LOG_LINES,
+    LogReadError,
+    find_log_file,
+    gather_logs,
+    read_log_tail,
+)
 from .directories import ensure_required_directories
 
+try:  # pragma: no cover - optional dependency
+    from orjson import loads as _decode_json_body
+except ImportError:  # pragma: no cover - optional dependency
+    _decode_json_body = json.loads
+
 LOGGER = logging.getLogger("pullpilot.api.config")
 
 DEFAULT_CONFIG_PATH = get_resource_path("config/updater.conf")
-DEFAULT_SCHEMA_PATH = get_resource_path("config/schema.json")
 
 
 ProcessRunner = Callable[..., subprocess.CompletedProcess[str]]
 LogGatherer = Callable[[Optional[str]], Dict[str, Any]]
 EnsureDirectoriesFn = Callable[[ConfigData], Optional[Tuple[int, Dict[str, Any]]]]
+RouteHandler = Callable[[Optional[Mapping[str, Any]]], Tuple[int, Dict[str, Any]]]
+FilesSignature = Tuple[Tuple[Path, Optional[Tuple[int, int]]], ...]
+
+# Route table key for handlers that accept every HTTP method.
+_ANY_METHOD = "*"
+
+# Path sets consulted by ``_check_auth`` on every request.
+_UI_PUBLIC_PATHS = frozenset(
+    {"/", "/ui", "/ui/", "/ui/styles.css", "/ui/app.js", "/ui/manifest.json"}
+)
+_UI_PUBLIC_PREFIXES = ("/ui/assets",)
+_UI_AUTH_ONLY_PATHS = frozenset({"/ui/auth-check"})
+# First path segments that require a token, minus the public UI entries above.
+_PROTECTED_SEGMENTS = frozenset({"/config", "/schedule", "/ui"})
+
+# Static response bodies shared across requests; they are never mutated.
+_ERR_MISSING_CREDENTIALS: Dict[str, Any] = {
+    "error": "missing credentials",
+    "details": f"Set the {TOKEN_ENV} environment variable and send an Authorization header.",
+}
+_ERR_UNAUTHORIZED: Dict[str, Any] = {"error": "unauthorized"}
+_ERR_NOT_FOUND: Dict[str, Any] = {"error": "not found"}
+_ERR_METHOD_NOT_ALLOWED: Dict[str, Any] = {"error": "method not allowed"}
+_ERR_MISSING_PAYLOAD: Dict[str, Any] = {"error": "missing payload"}
+_ERR_PAYLOAD_NOT_OBJECT: Dict[str, Any] = {"error": "payload must be an object"}
+_ERR_NAME_NOT_STRING: Dict[str, Any] = {"error": "'name' must be a string"}
+_ERR_VALUES_NOT_OBJECT: Dict[str, Any] = {"error": "'values' must be an object"}
+_ERR_MULTILINE_NOT_OBJECT: Dict[str, Any] = {"error": "'multiline' must be an object"}
+
+
+def _files_signature(paths: Iterable[Path]) -> FilesSignature:
+    """Return ``(path, (mtime_ns, size))`` pairs; missing files map to ``None``."""
+
+    signature = []
+    for path in paths:
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            signature.append((path, None))
+        else:
+            signature.append((path, (file_stat.st_mtime_ns, file_stat.st_size)))
+    return tuple(signature)
 
 
 class ConfigAPI:
@@ -55,7 +115,12 @@ class ConfigAPI:
         self._updater_command = updater_command
         self._process_runner = process_runner or subprocess.run
         self._ensure_required_directories = ensure_directories or ensure_required_directories
-        self._log_gatherer = log_gatherer or (lambda selected: gather_logs(self.store, selected))
+        self._log_gatherer = log_gatherer or (
+            lambda selected: gather_logs(self.store, selected, config=self._load_config())
+        )
+        self._routes = self._build_routes()
+        self._schema_payload_cache: Optional[Tuple[ConfigStore, Dict[str, Any]]] = None
+        self._load_cache: Optional[Tuple[ConfigStore, FilesSignature, ConfigData]] = None
 
     # ------------------------------------------------------------------
     # Request helpers
@@ -67,154 +132,190 @@ class ConfigAPI:
         headers: Optional[Mapping[str, str]] = None,
     ) -> Tuple[int, Dict[str, Any]]:
         method = method.upper()
-        ui_public_paths = {
-            "/",
-            "/ui",
-            "/ui/",
-            "/ui/styles.css",
-            "/ui/app.js",
-            "/ui/manifest.json",
-        }
-        ui_public_prefixes = ("/ui/assets",)
-        ui_auth_only_paths = {"/ui/auth-check"}
-        is_ui_request = path == "/" or path.startswith("/ui")
-        is_public_asset_request = any(path.startswith(prefix) for prefix in ui_public_prefixes)
-        requires_auth = (
-            path in ui_auth_only_paths
-            or (
-                not is_public_asset_request
-                and path not in ui_public_paths
-                and (path.startswith("/ui") or path in {"/config", "/schedule"})
-            )
+        auth_error = self._check_auth(path, headers)
+        if auth_error is not None:
+            return auth_error
+        return self._dispatch_authenticated(method, path, payload)
+
+    def handle_request_bytes(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Handle a request whose payload is still the raw JSON body.
+
+        Decoding is deferred until the request has been authorized so rejected
+        calls never pay for parsing, and the body is only decoded once.
+        """
+
+        method = method.upper()
+        auth_error = self._check_auth(path, headers)
+        if auth_error is not None:
+            return auth_error
+        return self._dispatch_authenticated_bytes(method, path, body)
+
+    def read_log_content(self, name: str, max_lines: int = MAX_UI_LOG_LINES) -> Optional[str]:
+        """Return the last ``max_lines`` of log ``name`` or ``None`` when it is absent.
+
+        Raises :class:`LogReadError` when the file exists but cannot be read.
+        """
+
+        log_path = find_log_file(self.store, name, config=self._load_config())
+        if log_path is None:
+            return None
+        return read_log_tail(log_path, max_lines=max_lines)
+
+    def _check_auth(
+        self, path: str, headers: Optional[Mapping[str, str]]
+    ) -> Optional[Tuple[int, Dict[str, Any]]]:
+        segment_end = path.find("/", 1)
+        segment = path if segment_end < 0 else path[:segment_end]
+        requires_auth = path in _UI_AUTH_ONLY_PATHS or (
+            segment in _PROTECTED_SEGMENTS
+            and path not in _UI_PUBLIC_PATHS
+            and not path.startswith(_UI_PUBLIC_PREFIXES)
         )
         if requires_auth:
             if not self.authenticator or not self.authenticator.configured:
-                return (
-                    HTTPStatus.UNAUTHORIZED,
-                    {
-                        "error": "missing credentials",
-                        "details": (
-                            "Set the "
-                            f"{TOKEN_ENV} environment variable and send an Authorization header."
-                        ),
-                    },
-                )
+                return HTTPStatus.UNAUTHORIZED, _ERR_MISSING_CREDENTIALS
             if not self.authenticator.authorize(headers):
-                return HTTPStatus.UNAUTHORIZED, {"error": "unauthorized"}
-
-        if is_ui_request:
-            return self._handle_ui_request(method, path, payload)
-        if path not in {"/config", "/schedule"}:
-            return HTTPStatus.NOT_FOUND, {"error": "not found"}
-
-        if path == "/config":
-            if method == "GET":
-                try:
-                    data = self.store.load()
-                except Exception as exc:
-                    return HTTPStatus.INTERNAL_SERVER_ERROR, {
-                        "error": "failed to load configuration",
-                        "details": str(exc),
-                    }
-                return HTTPStatus.OK, self._serialize(data)
-            if method == "PUT":
-                return self._handle_put(payload)
-            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"}
+                return HTTPStatus.UNAUTHORIZED, _ERR_UNAUTHORIZED
+        return None
 
-        if method == "GET":
+    # The ``_dispatch_authenticated*`` helpers assume the caller already ran
+    # the authorization check (``handle_request*`` or the FastAPI dependency)
+    # and expect ``method`` to be upper-case.
+    def _dispatch_authenticated_bytes(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        payload = None
+        if body:
             try:
-                data = self.schedule_store.load()
-            except (ScheduleValidationError, json.JSONDecodeError) as exc:
-                return HTTPStatus.INTERNAL_SERVER_ERROR, {
-                    "error": "failed to load schedule",
+                payload = _decode_json_body(body)
+            except ValueError as exc:
+                return HTTPStatus.BAD_REQUEST, {
+                    "error": "invalid JSON payload",
                     "details": str(exc),
                 }
-            return HTTPStatus.OK, data.to_dict()
-        if method == "PUT":
-            return self._handle_schedule_put(payload)
-        return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"}
+        return self._dispatch_authenticated(method, path, payload)
 
-    # ------------------------------------------------------------------
-    # UI helpers
-    def _handle_ui_request(
+    def _dispatch_authenticated(
         self,
         method: str,
         path: str,
         payload: Optional[Mapping[str, Any]] = None,
     ) -> Tuple[int, Dict[str, Any]]:
-        if path == "/ui/config":
-            if method == "GET":
-                try:
-                    data = self.store.load()
-                except Exception as exc:
-                    return HTTPStatus.INTERNAL_SERVER_ERROR, {
-                        "error": "failed to load configuration",
-                        "details": str(exc),
-                    }
-                return HTTPStatus.OK, self._serialize(data)
-            if method in {"POST", "PUT"}:
-                return self._handle_put(payload)
-            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"}
-
-        if path == "/ui/auth-check":
-            if method == "GET":
-                return HTTPStatus.NO_CONTENT, {}
-            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"}
-
-        if path == "/ui/logs":
-            if method not in {"GET", "POST"}:
-                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"}
-            if payload is not None and not isinstance(payload, Mapping):
-                return HTTPStatus.BAD_REQUEST, {"error": "payload must be an object"}
-            selected_name = None
-            if payload is not None:
-                candidate = payload.get("name")
-                if candidate is not None and not isinstance(candidate, str):
-                    return HTTPStatus.BAD_REQUEST, {"error": "'name' must be a string"}
-                selected_name = candidate
-            try:
-                logs_payload = self._log_gatherer(selected_name)
-            except ConfigError as exc:
-                LOGGER.warning("Configuration error while gathering logs", exc_info=True)
-                return HTTPStatus.INTERNAL_SERVER_ERROR, {
-                    "error": "failed to load logs",
-                    "details": str(exc),
-                }
-            except LogReadError as exc:
-                LOGGER.warning("Log read error while gathering logs", exc_info=True)
-                return HTTPStatus.INTERNAL_SERVER_ERROR, {
-                    "error": "failed to load logs",
-                    "details": str(exc),
-                }
-            except Exception as exc:
-                LOGGER.warning("Unexpected error while gathering logs", exc_info=True)
-                return HTTPStatus.INTERNAL_SERVER_ERROR, {
-                    "error": "failed to load logs",
-                    "details": str(exc),
-                }
-            return HTTPStatus.OK, logs_payload
+        methods = self._routes.get(path)
+        if methods is None:
+            return HTTPStatus.NOT_FOUND, _ERR_NOT_FOUND
+        handler = methods.get(method) or methods.get(_ANY_METHOD)
+        if handler is None:
+            return HTTPStatus.METHOD_NOT_ALLOWED, _ERR_METHOD_NOT_ALLOWED
+        return handler(payload)
+
+    def _build_routes(self) -> Dict[str, Dict[str, RouteHandler]]:
+        ui_root = {_ANY_METHOD: self._handle_ui_root}
+        return {
+            "/config": {"GET": self._handle_config_get, "PUT": self._handle_put},
+            "/schedule": {"GET": self._handle_schedule_get, "PUT": self._handle_schedule_put},
+            "/": ui_root,
+            "/ui": ui_root,
+            "/ui/": ui_root,
+            "/ui/config": {
+                "GET": self._handle_config_get,
+                "POST": self._handle_put,
+                "PUT": self._handle_put,
+            },
+            "/ui/auth-check": {"GET": self._handle_auth_check},
+            "/ui/logs": {"GET": self._handle_logs, "POST": self._handle_logs},
+            "/ui/run-test": {"POST": self._handle_run_test},
+        }
 
-        if path in {"/", "/ui", "/ui/"}:
-            return HTTPStatus.OK, {"message": "ui"}
+    # ------------------------------------------------------------------
+    # Route handlers
+    def _handle_config_get(
+        self, payload: Optional[Mapping[str, Any]]
+    ) -> Tuple[int, Dict[str, Any]]:
+        try:
+            data = self._load_config()
+        except Exception as exc:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {
+                "error": "failed to load configuration",
+                "details": str(exc),
+            }
+        return HTTPStatus.OK, self._serialize(data)
 
-        if path == "/ui/run-test":
-            if method != "POST":
-                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"}
-            return self._handle_run_test()
+    def _handle_schedule_get(
+        self, payload: Optional[Mapping[str, Any]]
+    ) -> Tuple[int, Dict[str, Any]]:
+        try:
+            data = self.schedule_store.load()
+        except (ScheduleValidationError, json.JSONDecodeError) as exc:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {
+                "error": "failed to load schedule",
+                "details": str(exc),
+            }
+        return HTTPStatus.OK, data.to_dict()
 
-        return HTTPStatus.NOT_FOUND, {"error": "not found"}
+    # ------------------------------------------------------------------
+    # UI helpers
+    def _handle_ui_root(self, payload: Optional[Mapping[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+        return HTTPStatus.OK, {"message": "ui"}
+
+    def _handle_auth_check(
+        self, payload: Optional[Mapping[str, Any]]
+    ) -> Tuple[int, Dict[str, Any]]:
+        return HTTPStatus.NO_CONTENT, {}
+
+    def _handle_logs(self, payload: Optional[Mapping[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+        if payload is not None and not isinstance(payload, Mapping):
+            return HTTPStatus.BAD_REQUEST, _ERR_PAYLOAD_NOT_OBJECT
+        selected_name = None
+        if payload is not None:
+            candidate = payload.get("name")
+            if candidate is not None and not isinstance(candidate, str):
+                return HTTPStatus.BAD_REQUEST, _ERR_NAME_NOT_STRING
+            selected_name = candidate
+        try:
+            logs_payload = self._log_gatherer(selected_name)
+        except ConfigError as exc:
+            LOGGER.warning("Configuration error while gathering logs", exc_info=True)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {
+                "error": "failed to load logs",
+                "details": str(exc),
+            }
+        except LogReadError as exc:
+            LOGGER.warning("Log read error while gathering logs", exc_info=True)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {
+                "error": "failed to load logs",
+                "details": str(exc),
+            }
+        except Exception as exc:
+            LOGGER.warning("Unexpected error while gathering logs", exc_info=True)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {
+                "error": "failed to load logs",
+                "details": str(exc),
+            }
+        return HTTPStatus.OK, logs_payload
 
     def _handle_put(self, payload: Optional[Mapping[str, Any]]) -> Tuple[int, Dict[str, Any]]:
         if payload is None:
-            return HTTPStatus.BAD_REQUEST, {"error": "missing payload"}
+            return HTTPStatus.BAD_REQUEST, _ERR_MISSING_PAYLOAD
+        if not isinstance(payload, Mapping):
+            return HTTPStatus.BAD_REQUEST, _ERR_PAYLOAD_NOT_OBJECT
         values = payload.get("values")
         if not isinstance(values, Mapping):
-            return HTTPStatus.BAD_REQUEST, {"error": "'values' must be an object"}
+            return HTTPStatus.BAD_REQUEST, _ERR_VALUES_NOT_OBJECT
         multiline = payload.get("multiline")
         sanitized_multiline: Dict[str, str] = {}
         if multiline is not None:
             if not isinstance(multiline, Mapping):
-                return HTTPStatus.BAD_REQUEST, {"error": "'multiline' must be an object"}
+                return HTTPStatus.BAD_REQUEST, _ERR_MULTILINE_NOT_OBJECT
 
             errors = []
             for key, value in multiline.items():
@@ -247,6 +348,7 @@ class ConfigAPI:
         if directory_error is not None:
             return directory_error
 
+        self._load_cache = None
         try:
             data = self.store.save(values, sanitized_multiline if multiline is not None else None)
         except ValidationError as exc:
@@ -257,9 +359,9 @@ class ConfigAPI:
 
     def _handle_schedule_put(self, payload: Optional[Mapping[str, Any]]) -> Tuple[int, Dict[str, Any]]:
         if payload is None:
-            return HTTPStatus.BAD_REQUEST, {"error": "missing payload"}
+            return HTTPStatus.BAD_REQUEST, _ERR_MISSING_PAYLOAD
         if not isinstance(payload, Mapping):
-            return HTTPStatus.BAD_REQUEST, {"error": "payload must be an object"}
+            return HTTPStatus.BAD_REQUEST, _ERR_PAYLOAD_NOT_OBJECT
         try:
             data = self.schedule_store.save(payload)
         except ScheduleValidationError as exc:
@@ -283,12 +385,54 @@ class ConfigAPI:
         return HTTPStatus.OK, data.to_dict()
 
     # ------------------------------------------------------------------
+    def _load_config(self) -> ConfigData:
+        """Return ``store.load()``, reusing the last result while its files are unchanged.
+
+        The cached :class:`ConfigData` is shared between requests and must be
+        treated as read-only.
+        """
+
+        store = self.store
+        cached = self._load_cache
+        if cached is not None and cached[0] is store:
+            signature = cached[1]
+            if _files_signature(path for path, _ in signature) == signature:
+                return cached[2]
+
+        config_signature = _files_signature((store.config_path,))
+        data = store.load()
+        if config_signature[0][1] is None:
+            self._load_cache = None
+            return data
+        multiline_paths = (
+            Path(str(data.values[key])).expanduser()
+            for key in store.multiline_fields
+            if data.values.get(key)
+        )
+        self._load_cache = (store, config_signature + _files_signature(multiline_paths), data)
+        return data
+
     def _serialize(self, data: ConfigData) -> Dict[str, Any]:
         payload = data.to_dict()
-        payload["schema"] = self.store.schema_overview()
-        payload["meta"] = {"multiline_fields": self.store.multiline_fields}
+        payload.update(self._schema_payload())
         return payload
 
+    def _schema_payload(self) -> Dict[str, Any]:
+        # The schema is loaded once per store and never changes afterwards, so
+        # the response metadata only needs rebuilding if ``store`` is replaced.
+        store = self.store
+        cached = self._schema_payload_cache
+        if cached is None or cached[0] is not store:
+            cached = (
+                store,
+                {
+                    "schema": store.schema_overview(),
+                    "meta": {"multiline_fields": store.multiline_fields},
+                },
+            )
+            self._schema_payload_cache = cached
+        return cached[1]
+
     def _resolve_updater_command(self) -> list[str]:
         command = self._updater_command
         if command is None:
@@ -312,7 +456,9 @@ class ConfigAPI:
             raise ValueError("updater command is empty")
         return normalized
 
-    def _handle_run_test(self) -> Tuple[int, Dict[str, Any]]:
+    def _handle_run_test(
+        self, payload: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[int, Dict[str, Any]]:
         try:
             command = self._resolve_updater_command()
         except Exception as exc:
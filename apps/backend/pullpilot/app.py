@@ -1,6 +1,8 @@
 """Application factory for Pullpilot's backend services."""
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 try:  # pragma: no cover - optional dependency
@@ -11,7 +13,11 @@ except ImportError:  # pragma: no cover - optional dependency
 from .api import ConfigAPI
 from .config import ConfigStore
 from .schedule import ScheduleStore
-from .ui.application import configure_application
+from .ui.application import configure_application, json_response_class
+
+# Upper bound for blocking work (config I/O, log tails, test runs) dispatched
+# from async routes.
+API_EXECUTOR_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def create_app(
@@ -24,6 +30,14 @@ def create_app(
     if FastAPI is None:  # pragma: no cover - exercised when FastAPI is unavailable
         return api
 
-    app = FastAPI()
+    app = FastAPI(default_response_class=json_response_class())
+    app.state.executor = ThreadPoolExecutor(
+        max_workers=API_EXECUTOR_MAX_WORKERS, thread_name_prefix="pullpilot-api"
+    )
+
+    def _shutdown_executor() -> None:  # pragma: no cover - FastAPI runtime
+        app.state.executor.shutdown(wait=False)
+
+    app.add_event_handler("shutdown", _shutdown_executor)
     configure_application(app, api)
     return app
@@ -6,13 +6,15 @@ import logging
 import os
 import stat
 from pathlib import Path
-from typing import Iterable, Mapping, Optional
+from typing import Iterable, Mapping, Optional, Tuple
 
 LOGGER = logging.getLogger("pullpilot.auth")
 
 TOKEN_ENV = "PULLPILOT_TOKEN"
 TOKEN_FILE_ENV = "PULLPILOT_TOKEN_FILE"
 
+_TOKEN_SCHEMES = frozenset({"bearer", "token"})
+
 
 def _normalize_env_value(value: Optional[str]) -> Optional[str]:
     """Normalize environment variables used for authentication."""
@@ -92,12 +94,26 @@ def _load_token_from_env_files() -> Optional[str]:
         if not path.is_file():
             continue
         try:
-            content = path.read_text(encoding="utf-8")
+            normalized = _scan_env_file_for_token(path)
         except OSError:
             continue
-        for line in content.splitlines():
+        if normalized is None:
+            continue
+        os.environ[TOKEN_ENV] = normalized
+        return normalized
+    return None
+
+
+_ENV_TOKEN_LINE_PREFIXES = (TOKEN_ENV, "export")
+
+
+def _scan_env_file_for_token(path: Path) -> Optional[str]:
+    """Return the token assigned in ``path``, stopping at the first match."""
+
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        for line in handle:
             stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
+            if not stripped.startswith(_ENV_TOKEN_LINE_PREFIXES):
                 continue
             if stripped.startswith("export"):
                 remainder = stripped[len("export"):]
@@ -111,7 +127,6 @@ def _load_token_from_env_files() -> Optional[str]:
             normalized = _normalize_env_value(_strip_inline_comments(raw_value))
             if normalized is None:
                 continue
-            os.environ[TOKEN_ENV] = normalized
             return normalized
     return None
 
@@ -209,6 +224,23 @@ class Authenticator:
     def __init__(self, *, token: Optional[str] = None) -> None:
         self.token = token
 
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        self._token = value
+        # Canonical header values accepted without any parsing; anything else
+        # (other casing, extra whitespace) goes through ``_match_token``.
+        if value:
+            self._expected_headers: Tuple[bytes, ...] = (
+                f"Bearer {value}".encode("utf-8"),
+                f"Token {value}".encode("utf-8"),
+            )
+        else:
+            self._expected_headers = ()
+
     @classmethod
     def from_env(cls) -> "Authenticator":
         """Create an authenticator from environment variables."""
@@ -227,18 +259,25 @@ class Authenticator:
         return self.token is not None
 
     def authorize(self, headers: Optional[Mapping[str, str]]) -> bool:
-        if not headers:
+        if not self.token or not headers:
             return False
-        auth_header = None
-        for key, value in headers.items():
-            if key.lower() == "authorization":
-                auth_header = value
-                break
+        # Starlette ``Headers`` look names up case-insensitively, so the
+        # request object can be passed as-is without copying it into a dict.
+        auth_header = headers.get("authorization")
+        if auth_header is None:
+            auth_header = headers.get("Authorization")
+        if auth_header is None:
+            for key, value in headers.items():
+                if key.lower() == "authorization":
+                    auth_header = value
+                    break
         if not auth_header:
             return False
-        if self.token:
-            return _match_token(self.token, auth_header)
-        return False
+        header_bytes = auth_header.encode("utf-8", "surrogateescape")
+        for expected in self._expected_headers:
+            if hmac.compare_digest(header_bytes, expected):
+                return True
+        return _match_token(self.token, auth_header)
 
 
 def _match_token(expected: str, header: str) -> bool:
@@ -251,9 +290,14 @@ def _match_token(expected: str, header: str) -> bool:
     scheme, value = parts
     if not value:
         return False
-    if scheme.lower() in {"bearer", "token"}:
-        return hmac.compare_digest(value, expected)
-    return False
+    if scheme.lower() not in _TOKEN_SCHEMES:
+        return False
+    # ``compare_digest`` rejects non-ASCII ``str`` input, so compare the
+    # encoded forms to stay constant-time for any header value.
+    return hmac.compare_digest(
+        value.encode("utf-8", "surrogateescape"),
+        expected.encode("utf-8", "surrogateescape"),
+    )
 
 
 __all__ = [
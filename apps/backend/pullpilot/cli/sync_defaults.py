@@ -28,8 +28,7 @@ def sync_defaults(target: Path, overwrite: bool) -> None:
     target = target.expanduser()
     target.mkdir(parents=True, exist_ok=True)
 
-    for entry in source.iterdir():
-        copy_config_tree(entry, target / entry.name, overwrite=overwrite)
+    copy_config_tree(source, target, overwrite=overwrite)
 
 
 def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
@@ -7,6 +7,8 @@ quoting where possible.
 """
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import logging
 import os
@@ -14,12 +16,17 @@ import re
 import shlex
 import tempfile
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 from .resources import get_resource_path
 
+try:  # pragma: no cover - optional dependency
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
 DEFAULT_SCHEMA_PATH = get_resource_path("config/schema.json")
 
 
@@ -53,16 +60,52 @@ class PersistenceError(ConfigError):
         self.details = [detail]
 
 
-@dataclass
+def _coerce_integer(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("integer expected")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip():
+        return int(value)
+    raise ValueError("integer expected")
+
+
+def _coerce_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        parsed = _parse_bool(value)
+        if parsed is not None:
+            return parsed
+    raise ValueError("boolean expected")
+
+
+def _coerce_string(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value)
+
+
+@dataclass(slots=True)
 class SchemaVariable:
     name: str
     type: str
     default: Any
     constraints: Dict[str, Any]
     description: str
+    # Compiled ``constraints["pattern"]``; the raw string stays in
+    # ``constraints`` for error messages and the schema overview.
+    pattern_re: Optional["re.Pattern[str]"] = field(default=None, repr=False, compare=False)
+    # Constraint checks bound to this variable's limits, built once when the
+    # schema is loaded; see ``ConfigStore._build_checks``.
+    checks: Tuple[Callable[[Any], Optional[str]], ...] = field(
+        default=(), repr=False, compare=False
+    )
+    # Input coercion for this variable's type; see ``ConfigStore._build_coercer``.
+    coerce: Callable[[Any], Any] = field(default=_coerce_string, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigData:
     values: "OrderedDict[str, Any]"
     multiline: Dict[str, str]
@@ -71,12 +114,15 @@ class ConfigData:
         return {"values": dict(self.values), "multiline": dict(self.multiline)}
 
 
-@dataclass
+@dataclass(slots=True)
 class CommentLine:
     text: str
 
+    def render(self, store: "ConfigStore") -> str:
+        return self.text
 
-@dataclass
+
+@dataclass(slots=True)
 class AssignmentLine:
     prefix: str
     key: str
@@ -85,19 +131,120 @@ class AssignmentLine:
     inline_comment: str
     quote: Optional[str]
     value: Any
+    # Schema entry for ``key`` (``None`` for unknown keys), bound when the
+    # line is parsed or appended so formatting needs no schema lookup.
+    variable: Optional[SchemaVariable] = field(default=None, repr=False, compare=False)
+
+    def render(self, store: "ConfigStore") -> str:
+        rendered = (
+            f"{self.prefix}{self.key}{self.key_suffix}="
+            f"{self.post_equal_ws}{store._format_value(self)}{self.inline_comment}"
+        )
+        return rendered.rstrip()
 
 
 ParsedLine = Tuple[Any, int]
 
-_BOOL_TRUE = {"1", "true", "yes", "on"}
-_BOOL_FALSE = {"0", "false", "no", "off"}
-_MULTILINE_FIELDS: Set[str] = set()
+_BOOL_TRUE = frozenset({"1", "true", "yes", "on"})
+_BOOL_FALSE = frozenset({"0", "false", "no", "off"})
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_bool(text: str) -> Optional[bool]:
+    """Return the boolean spelled by ``text`` or ``None`` if it is not one."""
+
+    normalized = text.strip().lower()
+    if normalized in _BOOL_TRUE:
+        return True
+    if normalized in _BOOL_FALSE:
+        return False
+    return None
+
+
+_MULTILINE_FIELDS: FrozenSet[str] = frozenset()
+_MULTILINE_FIELDS_SORTED: Tuple[str, ...] = tuple(sorted(_MULTILINE_FIELDS))
+SchemaTables = Tuple[List[SchemaVariable], Dict[str, SchemaVariable], List[str]]
+# Parsed schemas keyed by resolved path; each entry records the
+# ``(st_mtime_ns, st_size)`` it was parsed from.
+_SCHEMA_CACHE: Dict[str, Tuple[Tuple[int, int], SchemaTables]] = {}
+# Runs of value text that cannot end a quote or start a comment, keyed by the
+# quote currently open (``None`` outside quotes). Escape pairs are part of the
+# run, so a lone backslash is only left over at the end of a line.
+_VALUE_RUNS: Dict[Optional[str], "re.Pattern[str]"] = {
+    None: re.compile(r"""[^\\"'#]*(?:\\.[^\\"'#]*)*""", re.DOTALL),
+    '"': re.compile(r'[^\\"]*(?:\\.[^\\"]*)*', re.DOTALL),
+    "'": re.compile(r"[^\\']*(?:\\.[^\\']*)*", re.DOTALL),
+}
+_QUOTE_CHARS = frozenset("\"'")
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f]")
+# Unquoted values must not contain whitespace (``\s`` matches exactly the
+# characters ``str.isspace`` accepts) or start an inline comment.
+_NEEDS_QUOTES_RE = re.compile(r"[\s#]")
 _SAFE_COMPOSE_TOKEN = re.compile(r"^[A-Za-z0-9._/-]+$")
 _ALLOWED_COMPOSE_SHORTCUTS = {("docker", "compose"), ("docker-compose",)}
+_ALLOWED_COMPOSE_COMMANDS = frozenset(" ".join(tokens) for tokens in _ALLOWED_COMPOSE_SHORTCUTS)
 
 LOGGER = logging.getLogger("pullpilot.config")
 
 
+def _has_parent_segment(path_text: str) -> bool:
+    """Return ``True`` when ``path_text`` has a ``..`` component."""
+
+    # Same answer as ``".." in Path(path_text).parts`` without building a Path.
+    if ".." not in path_text:
+        return False
+    if os.altsep:
+        path_text = path_text.replace(os.altsep, os.sep)
+    return ".." in path_text.split(os.sep)
+
+
+def _atomic_write_bytes(target: Path, data: bytes, operation: str) -> None:
+    """Replace ``target`` with ``data`` through a synced temporary file.
+
+    Nothing is written when ``target`` already holds ``data``. Write failures
+    remove the temporary file and raise :class:`PersistenceError` for
+    ``operation``; ``target`` is left untouched.
+    """
+
+    try:
+        if target.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, target)
+    except (OSError, PermissionError) as exc:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise PersistenceError(path=target, operation=operation, error=exc) from exc
+
+
+def _read_utf8(path: Path) -> str:
+    """Return ``path`` as ``read_text`` would, without the text I/O layers."""
+
+    data = path.read_bytes()
+    try:
+        # Most files are plain ASCII, which decodes without UTF-8 validation.
+        text = data.decode("ascii")
+    except UnicodeDecodeError:
+        text = data.decode("utf-8")
+    if "\r" in text:
+        # Match the universal-newline translation of text mode.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 class ConfigStore:
     """High level helper that loads and stores configuration values."""
 
@@ -110,11 +257,10 @@ class ConfigStore:
     ):
         self.config_path = Path(config_path).expanduser()
         self.schema_path = Path(schema_path).expanduser()
-        self.schema: List[SchemaVariable] = self._load_schema(self.schema_path)
-        self.schema_map: Dict[str, SchemaVariable] = {
-            variable.name: variable for variable in self.schema
-        }
-        self.schema_order: List[str] = [variable.name for variable in self.schema]
+        self.schema: List[SchemaVariable]
+        self.schema_map: Dict[str, SchemaVariable]
+        self.schema_order: List[str]
+        self.schema, self.schema_map, self.schema_order = self._schema_tables(self.schema_path)
         base_dirs = (
             list(allowed_multiline_dirs)
             if allowed_multiline_dirs is not None
@@ -124,19 +270,23 @@ class ConfigStore:
             Path(directory).expanduser().resolve()
             for directory in base_dirs
         ]
+        self._allowed_dir_parts: Tuple[Tuple[str, ...], ...] = tuple(
+            directory.parts for directory in self.allowed_multiline_dirs
+        )
+        self._document_cache: Optional[
+            Tuple[Tuple[int, int], List[Any], Dict[str, Any]]
+        ] = None
 
     # ------------------------------------------------------------------
     # Public helpers
     def load(self) -> ConfigData:
         """Return the current configuration merged with defaults."""
 
-        defaults = OrderedDict(
-            (variable.name, self._coerce_default(variable)) for variable in self.schema
-        )
-        document = self._read_document()
-        for line in document:
-            if isinstance(line, AssignmentLine) and line.key in defaults:
-                defaults[line.key] = line.value
+        defaults = OrderedDict(self._default_pairs)
+        _, assigned = self._document_snapshot()
+        for key, value in assigned.items():
+            if key in defaults:
+                defaults[key] = value
         multiline = self._load_multiline_content(defaults)
         return ConfigData(defaults, multiline)
 
@@ -151,9 +301,16 @@ class ConfigStore:
         multiline_payload = multiline or {}
         self._persist_multiline_files(sanitized, multiline_payload)
 
+        _, assigned = self._document_snapshot()
+        if all(key in assigned and assigned[key] == value for key, value in sanitized.items()):
+            # ``_validate`` requires every schema variable, so ``sanitized``
+            # already is what ``load()`` would return for the unchanged file.
+            return ConfigData(sanitized, self._load_multiline_content(sanitized))
         document = self._read_document()
         self._update_document(document, sanitized)
         self._write_document(document)
+        # Reparse rather than echo ``sanitized``: escapes added when writing
+        # quoted values are kept verbatim when the file is read back.
         return self.load()
 
     # ------------------------------------------------------------------
@@ -162,11 +319,27 @@ class ConfigStore:
     def multiline_fields(self) -> List[str]:
         """Return the list of variables that accept multiline payloads."""
 
-        return sorted(_MULTILINE_FIELDS)
+        return list(_MULTILINE_FIELDS_SORTED)
 
     def schema_overview(self) -> Dict[str, Any]:
-        """Expose schema metadata useful for client applications."""
+        """Expose schema metadata useful for client applications.
+
+        The schema is loaded once per store, so the overview is built on first
+        use and the same mapping is returned afterwards; treat it as read-only.
+        """
+
+        return self._schema_overview
 
+    @functools.cached_property
+    def _default_pairs(self) -> Tuple[Tuple[str, Any], ...]:
+        # Coerced defaults are immutable scalars, so every ``load()`` can
+        # start from the same pairs.
+        return tuple(
+            (variable.name, self._coerce_default(variable)) for variable in self.schema
+        )
+
+    @functools.cached_property
+    def _schema_overview(self) -> Dict[str, Any]:
         return {
             "variables": [
                 {
@@ -183,8 +356,30 @@ class ConfigStore:
 
     # ------------------------------------------------------------------
     # Schema helpers
+    def _schema_tables(self, path: Path) -> SchemaTables:
+        """Return the parsed schema for ``path``, shared between stores.
+
+        The tables are treated as read-only and reused until the schema file
+        changes on disk.
+        """
+
+        signature = path.stat()
+        key = str(path.resolve())
+        stamp = (signature.st_mtime_ns, signature.st_size)
+        cached = _SCHEMA_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        schema = self._load_schema(path)
+        tables = (
+            schema,
+            {variable.name: variable for variable in schema},
+            [variable.name for variable in schema],
+        )
+        _SCHEMA_CACHE[key] = (stamp, tables)
+        return tables
+
     def _load_schema(self, path: Path) -> List[SchemaVariable]:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = _json_loads(path.read_bytes())
         variables = raw.get("variables")
         if not isinstance(variables, list):
             raise ConfigError("invalid schema: missing 'variables'")
@@ -195,20 +390,122 @@ class ConfigStore:
             name = entry.get("name")
             var_type = entry.get("type")
             default = entry.get("default")
-            constraints = entry.get("constraints", {})
+            constraints = dict(entry.get("constraints", {}))
             if not isinstance(name, str) or not isinstance(var_type, str):
                 continue
-            parsed.append(
-                SchemaVariable(
-                    name=name,
-                    type=var_type,
-                    default=default,
-                    constraints=dict(constraints),
-                    description=str(entry.get("description", "")),
-                )
+            pattern = constraints.get("pattern")
+            pattern_re = None
+            if pattern:
+                try:
+                    pattern_re = re.compile(pattern)
+                except (re.error, TypeError) as exc:
+                    raise ConfigError(f"invalid schema: bad pattern for '{name}': {exc}") from exc
+            variable = SchemaVariable(
+                name=name,
+                type=var_type,
+                default=default,
+                constraints=constraints,
+                description=str(entry.get("description", "")),
+                pattern_re=pattern_re,
             )
+            variable.checks = self._build_checks(variable)
+            variable.coerce = self._build_coercer(variable)
+            parsed.append(variable)
         return parsed
 
+    @classmethod
+    def _build_coercer(cls, variable: SchemaVariable) -> Callable[[Any], Any]:
+        if variable.type == "integer":
+            return _coerce_integer
+        if variable.type == "boolean":
+            return _coerce_boolean
+        # string fallback
+        if variable.name == "COMPOSE_BIN":
+            return cls._normalize_compose_bin
+        if variable.name == "EXCLUDE_PROJECTS":
+            return cls._normalize_exclude_projects
+        return _coerce_string
+
+    @classmethod
+    def _build_checks(
+        cls, variable: SchemaVariable
+    ) -> Tuple[Callable[[Any], Optional[str]], ...]:
+        """Return the constraint checks for ``variable`` in evaluation order."""
+
+        constraints = variable.constraints
+        checks: List[Callable[[Any], Optional[str]]] = []
+
+        def limit(key: str) -> Optional[int]:
+            raw = constraints.get(key)
+            if raw is None:
+                return None
+            try:
+                return int(raw)
+            except (TypeError, ValueError) as exc:
+                raise ConfigError(
+                    f"invalid schema: bad {key} for '{variable.name}': {raw!r}"
+                ) from exc
+
+        def one_of(allowed_values: Iterable[Any]) -> str:
+            return "value must be one of: " + ", ".join(map(str, allowed_values))
+
+        if variable.type == "string":
+            if constraints.get("is_list"):
+                return (functools.partial(cls._check_list_constraint, variable),)
+            if not constraints.get("allow_empty", False):
+                checks.append(lambda value: "value cannot be empty" if value == "" else None)
+            pattern_re = variable.pattern_re
+            if pattern_re is not None:
+                pattern_message = f"value must match pattern {constraints['pattern']!r}"
+                checks.append(
+                    lambda value: None if pattern_re.fullmatch(value) else pattern_message
+                )
+            min_length = limit("min_length")
+            if min_length is not None:
+                min_length_message = f"minimum length is {constraints['min_length']}"
+                checks.append(
+                    lambda value: min_length_message if len(value) < min_length else None
+                )
+            max_length = limit("max_length")
+            if max_length is not None:
+                max_length_message = f"maximum length is {constraints['max_length']}"
+                checks.append(
+                    lambda value: max_length_message if len(value) > max_length else None
+                )
+            if constraints.get("disallow_path_traversal"):
+                checks.append(
+                    lambda value: "path cannot contain '..' segments"
+                    if value and _has_parent_segment(value)
+                    else None
+                )
+            if constraints.get("newline_separated_absolute_paths"):
+                checks.append(cls._check_newline_path_constraint)
+            string_allowed = constraints.get("allowed_values")
+            if string_allowed:
+                string_allowed_message = one_of(string_allowed)
+                checks.append(
+                    lambda value: string_allowed_message if value not in string_allowed else None
+                )
+        elif variable.type == "integer":
+            minimum = limit("min")
+            if minimum is not None:
+                minimum_message = f"minimum value is {constraints['min']}"
+                checks.append(lambda value: minimum_message if value < minimum else None)
+            maximum = limit("max")
+            if maximum is not None:
+                maximum_message = f"maximum value is {constraints['max']}"
+                checks.append(lambda value: maximum_message if value > maximum else None)
+        elif variable.type == "boolean":
+            boolean_allowed = constraints.get("allowed_values")
+            if boolean_allowed is not None:
+                boolean_allowed_message = one_of(boolean_allowed)
+                checks.append(
+                    lambda value: None
+                    if ("true" if value else "false") in boolean_allowed
+                    else boolean_allowed_message
+                )
+        return tuple(checks)
+
     def _coerce_default(self, variable: SchemaVariable) -> Any:
         if variable.type == "integer":
             return int(variable.default)
@@ -222,10 +519,12 @@ class ConfigStore:
         errors: List[Dict[str, Any]] = []
         sanitized: "OrderedDict[str, Any]" = OrderedDict()
 
+        known = 0
         for name in self.schema_order:
             if name not in values:
                 errors.append({"field": name, "message": "missing value"})
                 continue
+            known += 1
             variable = self.schema_map[name]
             try:
                 coerced = self._coerce_input(variable, values[name])
@@ -238,88 +537,29 @@ class ConfigStore:
                 continue
             sanitized[name] = coerced
 
-        for name in values:
-            if name not in self.schema_map:
-                errors.append({"field": name, "message": "unknown variable"})
+        if known != len(values):
+            # Only scan the payload when it holds keys outside the schema.
+            for name in values:
+                if name not in self.schema_map:
+                    errors.append({"field": name, "message": "unknown variable"})
 
         if errors:
             raise ValidationError(errors)
         return sanitized
 
     def _coerce_input(self, variable: SchemaVariable, value: Any) -> Any:
-        if variable.type == "integer":
-            if isinstance(value, bool):
-                raise ValueError("integer expected")
-            if isinstance(value, int):
-                return value
-            if isinstance(value, str) and value.strip():
-                return int(value)
-            raise ValueError("integer expected")
-        if variable.type == "boolean":
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                normalized = value.strip().lower()
-                if normalized in _BOOL_TRUE:
-                    return True
-                if normalized in _BOOL_FALSE:
-                    return False
-            raise ValueError("boolean expected")
-        # string fallback
-        if variable.name == "COMPOSE_BIN":
-            return self._normalize_compose_bin(value)
-        if variable.name == "EXCLUDE_PROJECTS":
-            return self._normalize_exclude_projects(value)
-        if value is None:
-            return ""
-        return str(value)
+        return variable.coerce(value)
 
     def _check_constraints(self, variable: SchemaVariable, value: Any) -> Optional[str]:
-        constraints = variable.constraints
-        if variable.type == "string":
-            string_value = str(value)
-            if constraints.get("is_list"):
-                return self._check_list_constraint(variable, string_value)
-            if not constraints.get("allow_empty", False) and string_value == "":
-                return "value cannot be empty"
-            pattern = constraints.get("pattern")
-            if pattern and not re.fullmatch(pattern, string_value):
-                return f"value must match pattern {pattern!r}"
-            min_length = constraints.get("min_length")
-            if min_length is not None and len(string_value) < int(min_length):
-                return f"minimum length is {min_length}"
-            max_length = constraints.get("max_length")
-            if max_length is not None and len(string_value) > int(max_length):
-                return f"maximum length is {max_length}"
-            if constraints.get("disallow_path_traversal") and string_value:
-                if ".." in Path(string_value).parts:
-                    return "path cannot contain '..' segments"
-            if constraints.get("newline_separated_absolute_paths"):
-                violation = self._check_newline_path_constraint(string_value)
-                if violation is not None:
-                    return violation
-            allowed_values = constraints.get("allowed_values")
-            if allowed_values and string_value not in allowed_values:
-                return "value must be one of: " + ", ".join(map(str, allowed_values))
-        elif variable.type == "integer":
-            integer_value = int(value)
-            minimum = constraints.get("min")
-            if minimum is not None and integer_value < int(minimum):
-                return f"minimum value is {minimum}"
-            maximum = constraints.get("max")
-            if maximum is not None and integer_value > int(maximum):
-                return f"maximum value is {maximum}"
-        elif variable.type == "boolean":
-            allowed_values = constraints.get("allowed_values")
-            if allowed_values is not None:
-                normalized = "true" if value else "false"
-                if normalized not in allowed_values:
-                    return "value must be one of: " + ", ".join(map(str, allowed_values))
+        # ``value`` has already been through ``variable.coerce``.
+        for check in variable.checks:
+            violation = check(value)
+            if violation is not None:
+                return violation
         return None
 
-    def _check_list_constraint(
-        self, variable: SchemaVariable, string_value: str
-    ) -> Optional[str]:
+    @staticmethod
+    def _check_list_constraint(variable: SchemaVariable, string_value: str) -> Optional[str]:
         constraints = variable.constraints
         allow_empty = constraints.get("allow_empty", False)
         if not string_value.strip():
@@ -341,9 +581,12 @@ class ConfigStore:
             return f"unsupported list separator {separator!r}"
         if not items:
             return None if allow_empty else "list must contain at least one item"
-        for item in items:
-            if any(ord(char) < 32 for char in item):
-                return "list cannot contain control characters"
+        # Whitespace controls such as tabs may be separators, so the per-item
+        # check only runs when the raw value has any control character at all.
+        if _CONTROL_CHAR_RE.search(string_value) is not None:
+            for item in items:
+                if _CONTROL_CHAR_RE.search(item) is not None:
+                    return "list cannot contain control characters"
         min_length = constraints.get("min_length")
         if min_length is not None and len(items) < int(min_length):
             return f"list must contain at least {min_length} items"
@@ -357,21 +600,22 @@ class ConfigStore:
                 return "list contains invalid values: " + ", ".join(map(str, invalid))
         return None
 
-    def _check_newline_path_constraint(self, string_value: str) -> Optional[str]:
+    @staticmethod
+    def _check_newline_path_constraint(string_value: str) -> Optional[str]:
         if not string_value.strip():
             return None
         for raw_line in string_value.splitlines():
             stripped = raw_line.strip()
             if not stripped:
                 continue
-            path_obj = Path(stripped)
-            if not path_obj.is_absolute():
+            if not os.path.isabs(stripped):
                 return "each path must be absolute"
-            if ".." in path_obj.parts:
+            if _has_parent_segment(stripped):
                 return "paths cannot contain '..' segments"
         return None
 
-    def _normalize_compose_bin(self, value: Any) -> str:
+    @staticmethod
+    def _normalize_compose_bin(value: Any) -> str:
         """Normalize the compose command to a vetted, space separated string."""
 
         if value is None:
@@ -379,6 +623,12 @@ class ConfigStore:
         text = str(value).strip()
         if not text:
             return ""
+        if text in _ALLOWED_COMPOSE_COMMANDS:
+            return text
+        simple_tokens = tuple(text.split())
+        if simple_tokens in _ALLOWED_COMPOSE_SHORTCUTS:
+            # Plain words need no shell-style lexing.
+            return " ".join(simple_tokens)
         try:
             tokens = shlex.split(text)
         except ValueError as exc:  # pragma: no cover - defensive
@@ -402,7 +652,8 @@ class ConfigStore:
             return " ".join(tokens)
         raise ValueError("unsupported compose command")
 
-    def _normalize_exclude_projects(self, value: Any) -> str:
+    @staticmethod
+    def _normalize_exclude_projects(value: Any) -> str:
         if value is None:
             return ""
         if isinstance(value, str):
@@ -419,17 +670,48 @@ class ConfigStore:
 
     # ------------------------------------------------------------------
     # Document helpers
+    def _document_snapshot(self) -> Tuple[List[Any], Dict[str, Any]]:
+        """Return the parsed config file and its ``key -> value`` assignments.
+
+        Both are cached by file mtime and size and shared between callers, so
+        they must not be mutated; use :meth:`_read_document` for a copy.
+        """
+
+        try:
+            file_stat = self.config_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            self._document_cache = None
+            return [], {}
+        cache_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self._document_cache
+        if cached is None or cached[0] != cache_key:
+            document = self._parse_document()
+            # Later assignments of a repeated key win, as when scanning lines.
+            assigned = {
+                line.key: line.value for line in document if isinstance(line, AssignmentLine)
+            }
+            cached = (cache_key, document, assigned)
+            self._document_cache = cached
+        return cached[1], cached[2]
+
     def _read_document(self) -> List[Any]:
-        if not self.config_path.exists():
-            return []
-        text = self.config_path.read_text(encoding="utf-8")
+        document, _ = self._document_snapshot()
+        # ``_update_document`` mutates assignments and appends to the list, so
+        # callers get their own copies of both.
+        return [
+            copy.copy(line) if isinstance(line, AssignmentLine) else line
+            for line in document
+        ]
+
+    def _parse_document(self) -> List[Any]:
+        text = _read_utf8(self.config_path)
         lines = text.split("\n")
         parsed: List[Any] = []
+        # A trailing newline leaves an empty last entry that is not a line of
+        # its own, although a value continued across lines may still read it.
+        stop = len(lines) - 1 if not lines[-1] else len(lines)
         index = 0
-        while index < len(lines):
-            line = lines[index]
-            if index == len(lines) - 1 and line == "":
-                break
+        while index < stop:
             parsed_line, consumed = self._parse_line(lines, index)
             parsed.append(parsed_line)
             index += consumed
@@ -454,7 +736,8 @@ class ConfigStore:
 
         value_text, inline_comment, consumed = self._consume_value(lines, index, value_chunk)
         quote = self._detect_quote(value_text)
-        parsed_value = self._decode_value(key, value_text, quote)
+        variable = self.schema_map.get(key)
+        parsed_value = self._decode_value(key, variable, value_text, quote)
         assignment = AssignmentLine(
             prefix=leading,
             key=key,
@@ -463,64 +746,86 @@ class ConfigStore:
             inline_comment=inline_comment,
             quote=quote,
             value=parsed_value,
+            variable=variable,
         )
         return assignment, consumed
 
     def _consume_value(self, lines: List[str], index: int, initial: str) -> Tuple[str, str, int]:
-        value_chars: List[str] = []
+        if '"' not in initial and "'" not in initial and "\\" not in initial:
+            # Without quotes or escapes the value ends on this line at the
+            # first ``#``.
+            value, hash_sign, comment = initial.partition("#")
+            if not hash_sign:
+                return value.rstrip("\r \t"), "", 1
+            stripped = value.rstrip(" \t")
+            return stripped.rstrip("\r \t"), f"{value[len(stripped):]}#{comment}", 1
+
+        value_chunks: List[str] = []
         inline_comment = ""
         consumed = 1
         in_quote: Optional[str] = None
         escaped = False
         current = initial
         line_index = index
+        last_index = len(lines) - 1
         while True:
-            for pos, ch in enumerate(current):
-                if escaped:
-                    value_chars.append(ch)
-                    escaped = False
-                    continue
+            pos = 0
+            length = len(current)
+            if escaped and length:
+                value_chunks.append(current[0])
+                escaped = False
+                pos = 1
+            while pos < length:
+                # Consume the longest run without a quote/comment boundary
+                # (escape pairs included) in one regex step.
+                run = _VALUE_RUNS[in_quote].match(current, pos)
+                end = run.end()
+                if end > pos:
+                    value_chunks.append(current[pos:end])
+                    pos = end
+                    if pos >= length:
+                        break
+                ch = current[pos]
+                pos += 1
                 if ch == "\\":
+                    # Only reachable for a trailing backslash: it escapes the
+                    # first character of the next line.
+                    value_chunks.append(ch)
                     escaped = True
-                    value_chars.append(ch)
-                    continue
-                if ch in {'"', "'"}:
-                    if in_quote is None:
-                        in_quote = ch
-                    elif in_quote == ch:
-                        in_quote = None
-                    value_chars.append(ch)
-                    continue
-                if ch == "#" and in_quote is None:
-                    trailing_ws = ""
-                    while value_chars and value_chars[-1] in (" ", "\t"):
-                        trailing_ws = value_chars.pop() + trailing_ws
-                    inline_comment = trailing_ws + current[pos:]
-                    current = ""
+                elif ch == "#":
+                    text = "".join(value_chunks)
+                    value = text.rstrip(" \t")
+                    value_chunks = [value]
+                    inline_comment = text[len(value) :] + current[pos - 1 :]
                     break
-                value_chars.append(ch)
-            else:
-                current = ""
-            if current:
-                continue
-            if in_quote is None:
+                else:
+                    in_quote = ch if in_quote is None else None
+                    value_chunks.append(ch)
+            if inline_comment or in_quote is None:
                 break
-            line_index += 1
-            if line_index >= len(lines):
+            if line_index >= last_index:
                 break
+            line_index += 1
             consumed += 1
             current = lines[line_index]
-            value_chars.append("\n")
-        value_text = "".join(value_chars).rstrip("\r \t")
+            value_chunks.append("\n")
+        value_text = "".join(value_chunks).rstrip("\r \t")
         return value_text, inline_comment, consumed
 
     def _detect_quote(self, value_text: str) -> Optional[str]:
-        if len(value_text) >= 2 and value_text[0] == value_text[-1] and value_text[0] in {'"', "'"}:
-            return value_text[0]
+        if len(value_text) >= 2:
+            first = value_text[0]
+            if first in _QUOTE_CHARS and value_text.endswith(first):
+                return first
         return None
 
-    def _decode_value(self, key: str, value_text: str, quote: Optional[str]) -> Any:
-        variable = self.schema_map.get(key)
+    def _decode_value(
+        self,
+        key: str,
+        variable: Optional[SchemaVariable],
+        value_text: str,
+        quote: Optional[str],
+    ) -> Any:
         raw_value = value_text
         if quote is not None:
             raw_value = raw_value[1:-1]
@@ -529,11 +834,9 @@ class ConfigStore:
         if variable.type == "integer":
             return int(raw_value)
         if variable.type == "boolean":
-            normalized = raw_value.strip().lower()
-            if normalized in _BOOL_TRUE:
-                return True
-            if normalized in _BOOL_FALSE:
-                return False
+            parsed = _parse_bool(raw_value)
+            if parsed is not None:
+                return parsed
             raise ConfigError(f"invalid boolean value for {key}")
         return raw_value
 
@@ -543,6 +846,8 @@ class ConfigStore:
             if isinstance(line, AssignmentLine) and line.key in values:
                 line.value = values[line.key]
                 seen.add(line.key)
+        if len(seen) == len(values):
+            return
         for key in self.schema_order:
             if key in values and key not in seen:
                 variable = self.schema_map[key]
@@ -556,55 +861,19 @@ class ConfigStore:
                         inline_comment="",
                         quote=quote,
                         value=values[key],
+                        variable=variable,
                     )
                 )
 
     def _write_document(self, document: Iterable[Any]) -> None:
-        lines: List[str] = []
-        for line in document:
-            if isinstance(line, CommentLine):
-                lines.append(line.text)
-            elif isinstance(line, AssignmentLine):
-                formatted = self._format_value(line)
-                rendered = (
-                    f"{line.prefix}{line.key}{line.key_suffix}="
-                    f"{line.post_equal_ws}{formatted}{line.inline_comment}"
-                )
-                lines.append(rendered.rstrip())
-        text = "\n".join(lines)
+        text = "\n".join([line.render(self) for line in document])
         if text and not text.endswith("\n"):
             text += "\n"
-        directory = self.config_path.parent
-        directory.mkdir(parents=True, exist_ok=True)
-        fd, tmp_name = tempfile.mkstemp(
-            dir=directory,
-            prefix=f".{self.config_path.name}.",
-            suffix=".tmp",
-        )
-        tmp_path = Path(tmp_name)
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                handle.write(text)
-                handle.flush()
-                os.fsync(handle.fileno())
-            os.replace(tmp_path, self.config_path)
-        except (OSError, PermissionError) as exc:
-            try:
-                os.close(fd)
-            except OSError:
-                pass
-            try:
-                tmp_path.unlink()
-            except FileNotFoundError:
-                pass
-            except OSError:
-                pass
-            raise PersistenceError(
-                path=self.config_path, operation="write configuration", error=exc
-            ) from exc
+        self._document_cache = None
+        _atomic_write_bytes(self.config_path, text.encode("utf-8"), "write configuration")
 
     def _format_value(self, line: AssignmentLine) -> str:
-        variable = self.schema_map.get(line.key)
+        variable = line.variable
         value = line.value
         if variable is None:
             return str(value)
@@ -622,9 +891,9 @@ class ConfigStore:
         return f"{quote}{escaped}{quote}"
 
     def _choose_quote(self, current: Optional[str], value: str) -> Optional[str]:
-        if current in {'"', "'"}:
+        if current in _QUOTE_CHARS:
             return current
-        if value == "" or any(c.isspace() for c in value) or "#" in value or "\n" in value:
+        if value == "" or _NEEDS_QUOTES_RE.search(value):
             return '"'
         return None
 
@@ -637,7 +906,7 @@ class ConfigStore:
             if not path_value:
                 multiline[key] = ""
                 continue
-            file_path = Path(str(path_value)).expanduser()
+            file_path = Path(os.path.expanduser(str(path_value)))
             try:
                 try:
                     resolved = file_path.resolve()
@@ -653,7 +922,7 @@ class ConfigStore:
                 multiline[key] = ""
                 continue
             try:
-                multiline[key] = resolved.read_text(encoding="utf-8")
+                multiline[key] = _read_utf8(resolved)
             except FileNotFoundError:
                 multiline[key] = ""
             except OSError as exc:
@@ -685,7 +954,7 @@ class ConfigStore:
                     )
                 continue
             try:
-                normalized = self._normalize_multiline_path(key, Path(str(path_value)))
+                normalized = self._normalize_multiline_path(key, str(path_value))
             except ValidationError as exc:
                 errors.extend(exc.errors)
                 continue
@@ -695,40 +964,15 @@ class ConfigStore:
             raise ValidationError(errors)
 
         for target, content in pending_writes:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            fd, tmp_name = tempfile.mkstemp(
-                dir=target.parent,
-                prefix=f".{target.name}.",
-                suffix=".tmp",
-            )
-            tmp_path = Path(tmp_name)
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                    handle.write(content)
-                    handle.flush()
-                    os.fsync(handle.fileno())
-                os.replace(tmp_path, target)
-            except (OSError, PermissionError) as exc:
-                try:
-                    os.close(fd)
-                except OSError:
-                    pass
-                try:
-                    tmp_path.unlink()
-                except FileNotFoundError:
-                    pass
-                except OSError:
-                    pass
-                raise PersistenceError(
-                    path=target, operation="write multiline content", error=exc
-                ) from exc
+            _atomic_write_bytes(target, content.encode("utf-8"), "write multiline content")
 
-    def _normalize_multiline_path(self, key: str, raw: Path) -> Path:
-        normalized = raw.expanduser()
-        if not normalized.is_absolute():
+    def _normalize_multiline_path(self, key: str, raw: str) -> Path:
+        expanded = os.path.expanduser(raw)
+        if not os.path.isabs(expanded):
             raise ValidationError(
                 [{"field": key, "message": "path must be absolute"}]
             )
+        normalized = Path(expanded)
         try:
             try:
                 resolved = normalized.resolve()
@@ -756,13 +1000,13 @@ class ConfigStore:
         return resolved
 
     def _is_path_allowed(self, path: Path) -> bool:
-        for directory in self.allowed_multiline_dirs:
-            try:
-                path.relative_to(directory)
-            except ValueError:
-                continue
-            return True
-        return False
+        # Same test as ``path.relative_to(directory)`` succeeding, on
+        # precomputed part tuples and without exception control flow.
+        path_parts = path.parts
+        return any(
+            path_parts[: len(directory_parts)] == directory_parts
+            for directory_parts in self._allowed_dir_parts
+        )
 
 
 def validate_conf(
@@ -783,9 +1027,10 @@ def validate_conf(
         raise ConfigError(str(exc)) from exc
 
     values = data.values.copy()
-    for line in store._read_document():
-        if isinstance(line, AssignmentLine) and line.key not in store.schema_map:
-            values[line.key] = line.value
+    _, assigned = store._document_snapshot()
+    for key, value in assigned.items():
+        if key not in store.schema_map:
+            values[key] = value
 
     store._validate(values)
     return data
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
 
+import os
 import shutil
 
 
@@ -33,9 +34,28 @@ def copy_config_tree(
     """
 
     source = Path(source)
-    destination = Path(destination)
-
-    if source.is_dir():
+    _copy_tree(
+        source,
+        Path(destination),
+        source.is_dir(),
+        overwrite=overwrite,
+        on_directory_created=on_directory_created,
+        on_file_copied=on_file_copied,
+        error_handler=error_handler,
+    )
+
+
+def _copy_tree(
+    source: Path,
+    destination: Path,
+    source_is_dir: bool,
+    *,
+    overwrite: bool,
+    on_directory_created: Optional[PathCallback],
+    on_file_copied: Optional[PathCallback],
+    error_handler: Optional[ErrorHandler],
+) -> None:
+    if source_is_dir:
         created = False
         if not destination.exists():
             destination.mkdir(parents=True, exist_ok=True)
@@ -44,16 +64,22 @@ def copy_config_tree(
             on_directory_created(destination)
 
         try:
-            children = list(source.iterdir())
+            # ``DirEntry`` already knows each child's type, so the recursion
+            # does not stat it again.
+            with os.scandir(source) as entries:
+                children: List[Tuple[str, bool]] = [
+                    (entry.name, entry.is_dir()) for entry in entries
+                ]
         except OSError as exc:  # pragma: no cover - delegated behaviour
             if error_handler and error_handler("listdir", source, exc):
                 return
             raise
 
-        for child in children:
-            copy_config_tree(
-                child,
-                destination / child.name,
+        for name, is_dir in children:
+            _copy_tree(
+                source / name,
+                destination / name,
+                is_dir,
                 overwrite=overwrite,
                 on_directory_created=on_directory_created,
                 on_file_copied=on_file_copied,
@@ -1,42 +1,86 @@
 """Helper utilities to access bundled configuration and script resources."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from importlib import resources
 from pathlib import Path
 
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+import functools
 import logging
+import os
 import shutil
+import stat
 import tempfile
 
 
 _LOGGER = logging.getLogger(__name__)
 
-__all__ = ["get_resource_path", "resource_exists"]
+__all__ = [
+    "get_resource_path",
+    "invalidate_resource_cache",
+    "resource_exists",
+    "resource_tree_present",
+]
 
 _CACHE_DIR = Path(tempfile.gettempdir()) / "pullpilot" / "resources"
+_COPY_WORKERS = min(8, os.cpu_count() or 4)
+
+FileSignature = Tuple[int, int]
+DirectorySnapshot = Tuple[Dict[str, Tuple[int, int]], Tuple[str, ...]]
+# Source signature each cached copy was last validated against, keyed by the
+# cache target, so repeat lookups skip re-reading the cached copy.
+_VALIDATED: Dict[Path, Union[FileSignature, DirectorySnapshot]] = {}
 
 
 def _copy_file(source: resources.abc.Traversable, destination: Path) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     with resources.as_file(source) as resolved:
-        shutil.copy2(resolved, destination)
+        _copy_path(resolved, destination)
 
 
-def _copy_directory(source: resources.abc.Traversable, destination: Path) -> None:
-    if destination.exists():
-        if destination.is_file() or destination.is_symlink():
-            destination.unlink()
-        else:
+def _copy_path(source: Union[str, Path], destination: Union[str, Path]) -> None:
+    # copyfile uses the kernel fast path (sendfile on Linux); only the mode
+    # and timestamps are carried over (cache validation compares size and
+    # mtime).
+    shutil.copyfile(source, destination)
+    stats = os.stat(source)
+    os.chmod(destination, stat.S_IMODE(stats.st_mode))
+    os.utime(destination, ns=(stats.st_atime_ns, stats.st_mtime_ns))
+
+
+def _copy_directory(source: Path, destination: Path) -> None:
+    try:
+        existing = os.lstat(destination)
+    except FileNotFoundError:
+        pass
+    else:
+        if stat.S_ISDIR(existing.st_mode):
             shutil.rmtree(destination)
-    destination.mkdir(parents=True, exist_ok=True)
-    for entry in source.iterdir():
-        target = destination / entry.name
-        if entry.is_dir():
-            _copy_directory(entry, target)
         else:
-            _copy_file(entry, target)
+            destination.unlink()
+    destination.mkdir(parents=True, exist_ok=True)
+    # Create the directory tree first, then copy the files concurrently.
+    files: List[Tuple[str, str]] = []
+    pending = [(os.fspath(source), os.fspath(destination))]
+    while pending:
+        directory, target_directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                target = os.path.join(target_directory, entry.name)
+                if entry.is_dir():
+                    os.mkdir(target)
+                    pending.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+    if len(files) < 2:
+        for source_path, target in files:
+            _copy_path(source_path, target)
+        return
+    with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(files))) as executor:
+        for _ in executor.map(lambda item: _copy_path(*item), files):
+            pass
 
 
 def _ensure_cached(relative: str) -> Path:
@@ -44,60 +88,97 @@ def _ensure_cached(relative: str) -> Path:
     target = _CACHE_DIR / relative
     if origin.is_dir():
         with resources.as_file(origin) as resolved:
-            if _is_directory_cache_valid(resolved, target):
+            snapshot = _directory_signature(resolved)
+            if _is_directory_cache_valid(snapshot, target):
+                _remember(target, snapshot)
                 _log_cache_state(relative, target)
                 return target
-        _copy_directory(origin, target)
+            _copy_directory(resolved, target)
+        _remember(target, snapshot)
         _log_cache_state(relative, target)
         return target
     with resources.as_file(origin) as resolved:
-        if _is_file_cache_valid(resolved, target):
+        signature = _file_signature(resolved)
+        if _is_file_cache_valid(signature, target):
+            _remember(target, signature)
             _log_cache_state(relative, target)
             return target
     _copy_file(origin, target)
+    _remember(target, signature)
     _log_cache_state(relative, target)
     return target
 
 
-def _is_file_cache_valid(source: Path, destination: Path) -> bool:
-    if not destination.exists() or not destination.is_file():
-        return False
+def _remember(
+    target: Path, signature: Optional[Union[FileSignature, DirectorySnapshot]]
+) -> None:
+    if signature is None:
+        _VALIDATED.pop(target, None)
+    else:
+        _VALIDATED[target] = signature
+
+
+def _file_signature(path: Path) -> Optional[FileSignature]:
     try:
-        source_stat = source.stat()
-        dest_stat = destination.stat()
+        stats = path.stat()
     except OSError:
-        return False
-    return (
-        dest_stat.st_mtime_ns == source_stat.st_mtime_ns
-        and dest_stat.st_size == source_stat.st_size
-    )
+        return None
+    return stats.st_size, stats.st_mtime_ns
 
 
-def _is_directory_cache_valid(source: Path, destination: Path) -> bool:
-    if not destination.exists() or not destination.is_dir():
-        return False
+def _directory_signature(path: Path) -> Optional[DirectorySnapshot]:
     try:
-        source_snapshot = _snapshot_directory(source)
-        destination_snapshot = _snapshot_directory(destination)
+        return _snapshot_directory(path)
     except OSError:
+        return None
+
+
+def _is_file_cache_valid(source: Optional[FileSignature], destination: Path) -> bool:
+    if source is None or not destination.is_file():
+        return False
+    if _VALIDATED.get(destination) == source:
+        return True
+    return _file_signature(destination) == source
+
+
+def _is_directory_cache_valid(source: Optional[DirectorySnapshot], destination: Path) -> bool:
+    if source is None or not destination.is_dir():
         return False
-    return source_snapshot == destination_snapshot
+    if _VALIDATED.get(destination) == source:
+        return True
+    return _directory_signature(destination) == source
 
 
-def _snapshot_directory(base: Path) -> Tuple[Dict[str, Tuple[int, int]], Tuple[str, ...]]:
+def _snapshot_directory(base: Path) -> DirectorySnapshot:
+    # Same result as walking ``base.rglob("*")``, on plain strings: symlinked
+    # directories are listed but not descended into, and unreadable
+    # directories are skipped.
     files: Dict[str, Tuple[int, int]] = {}
     directories = set()
-    for path in base.rglob("*"):
-        relative = path.relative_to(base).as_posix()
-        if path.is_file():
-            stats = path.stat()
-            files[relative] = (stats.st_size, stats.st_mtime_ns)
-        elif path.is_dir():
-            directories.add(relative)
+    pending = [("", os.fspath(base))]
+    while pending:
+        prefix, directory = pending.pop()
+        try:
+            scanner = os.scandir(directory)
+        except PermissionError:
+            continue
+        with scanner:
+            for entry in scanner:
+                relative = prefix + entry.name
+                if entry.is_file():
+                    stats = entry.stat()
+                    files[relative] = (stats.st_size, stats.st_mtime_ns)
+                elif entry.is_dir():
+                    directories.add(relative)
+                    if not entry.is_symlink():
+                        pending.append((relative + "/", entry.path))
     return files, tuple(sorted(directories))
 
 
 def _log_cache_state(relative: str, target: Path) -> None:
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        # The summary walks the cached tree; skip it when nobody will see it.
+        return
     try:
         if target.is_file():
             stats = target.stat()
@@ -140,8 +221,26 @@ def get_resource_path(relative: str) -> Path:
     return _ensure_cached(relative)
 
 
+def invalidate_resource_cache(relative: Optional[str] = None) -> None:
+    """Forget that ``relative`` (or every resource) was validated.
+
+    The next :func:`get_resource_path` call compares the cached copy against
+    the packaged resource again instead of trusting the last check.
+    """
+
+    if relative is None:
+        _VALIDATED.clear()
+    else:
+        _VALIDATED.pop(_CACHE_DIR / relative, None)
+
+
+@functools.lru_cache(maxsize=128)
 def resource_exists(relative: str) -> bool:
-    """Return ``True`` when the given resource exists in the package."""
+    """Return ``True`` when the given resource exists in the package.
+
+    Which resources are packaged is fixed by the installed distribution, so
+    the answer is cached per ``relative``.
+    """
 
     try:
         origin = resources.files(__name__).joinpath(relative)
@@ -152,3 +251,23 @@ def resource_exists(relative: str) -> bool:
         return origin.is_file() or origin.is_dir()
     except FileNotFoundError:
         return False
+
+
+def resource_tree_present(relative: str, destination: Path) -> bool:
+    """Return ``True`` when every file of resource ``relative`` exists in ``destination``.
+
+    Only names are compared, against the packaged listing, so the resource
+    does not have to be extracted to the cache first.
+    """
+
+    try:
+        origin = resources.files(__name__).joinpath(relative)
+        return _tree_present(origin, destination)
+    except OSError:
+        return False
+
+
+def _tree_present(origin: resources.abc.Traversable, destination: Path) -> bool:
+    if not origin.is_dir():
+        return destination.exists()
+    return all(_tree_present(entry, destination / entry.name) for entry in origin.iterdir())
@@ -12,9 +12,9 @@ from typing import Iterable, Optional
 import uvicorn
 
 from .app import create_app
-from .config import ConfigStore
+from .config import DEFAULT_SCHEMA_PATH, ConfigStore
 from .config_utils import copy_config_tree
-from .resources import get_resource_path
+from .resources import get_resource_path, resource_tree_present
 from .schedule import ScheduleStore
 from .scheduler.watch import build_watcher
 
@@ -100,15 +100,14 @@ def _copy_missing_config(config_dir: Path, default_dir: Optional[Path]) -> None:
             )
         return True
 
-    for entry in default_dir.iterdir():
-        copy_config_tree(
-            entry,
-            config_dir / entry.name,
-            overwrite=False,
-            on_directory_created=_on_directory_created,
-            on_file_copied=_on_file_copied,
-            error_handler=_handle_error,
-        )
+    copy_config_tree(
+        default_dir,
+        config_dir,
+        overwrite=False,
+        on_directory_created=_on_directory_created,
+        on_file_copied=_on_file_copied,
+        error_handler=_handle_error,
+    )
 
 
 def _configure_logging(level: str) -> None:
@@ -121,14 +120,15 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
     _configure_logging(args.log_level)
 
     config_dir = _resolve_config_dir(args.config_dir)
-    default_dir = _discover_default_config_dir()
-    _copy_missing_config(config_dir, default_dir)
+    if resource_tree_present("config", config_dir):
+        # Nothing to bootstrap, so the defaults need not be extracted.
+        LOGGER.debug("Default configuration already present in %s", config_dir)
+    else:
+        _copy_missing_config(config_dir, _discover_default_config_dir())
 
     schedule_path = config_dir / "pullpilot.schedule"
     config_path = config_dir / "updater.conf"
-    schema_path = get_resource_path("config/schema.json")
-
-    store = ConfigStore(config_path, schema_path)
+    store = ConfigStore(config_path, DEFAULT_SCHEMA_PATH)
     schedule_store = ScheduleStore(schedule_path)
     app = create_app(store=store, schedule_store=schedule_store)
 
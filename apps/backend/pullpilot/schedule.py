@@ -1,18 +1,24 @@
 """Utilities for persisting and validating scheduler configuration."""
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
 import re
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping, MutableMapping, Optional
+from typing import Any, Mapping, MutableMapping, Optional, Tuple
 
 from .resources import get_resource_path
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_SCHEDULE_PATH = get_resource_path("config/pullpilot.schedule")
@@ -28,12 +34,11 @@ class ScheduleData:
     datetime: Optional[str] = None
 
     def to_dict(self) -> MutableMapping[str, Optional[str]]:
-        payload: MutableMapping[str, Optional[str]] = {"mode": self.mode}
         if self.mode == "cron":
-            payload["expression"] = self.expression
-        elif self.mode == "once":
-            payload["datetime"] = self.datetime
-        return payload
+            return {"mode": self.mode, "expression": self.expression}
+        if self.mode == "once":
+            return {"mode": self.mode, "datetime": self.datetime}
+        return {"mode": self.mode}
 
 
 class ScheduleValidationError(Exception):
@@ -71,11 +76,23 @@ class ScheduleStore:
 
     def __init__(self, schedule_path: Optional[Path] = None) -> None:
         self.schedule_path = Path(schedule_path or DEFAULT_SCHEDULE_PATH)
+        # ``(st_mtime_ns, st_size)`` of the file and the data validated from it.
+        self._load_cache: Optional[Tuple[Tuple[int, int], ScheduleData]] = None
 
     # ------------------------------------------------------------------
     def load(self) -> ScheduleData:
-        if not self.schedule_path.exists():
+        try:
+            file_stat = self.schedule_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return ScheduleData(mode="cron", expression=DEFAULT_CRON_EXPRESSION)
+        except OSError:
+            # Let the read below report the problem.
+            signature = None
+        else:
+            signature = (file_stat.st_mtime_ns, file_stat.st_size)
+            cached = self._load_cache
+            if cached is not None and cached[0] == signature:
+                return replace(cached[1])
         try:
             raw = self.schedule_path.read_text(encoding="utf-8") or "{}"
         except FileNotFoundError:
@@ -90,10 +107,14 @@ class ScheduleStore:
                 "No se pudo leer la programación almacenada; revisa los permisos del archivo."
             ) from exc
         payload = json.loads(raw)
-        return self._validate(payload)
+        data = self._validate(payload)
+        if signature is not None:
+            self._load_cache = (signature, replace(data))
+        return data
 
     def save(self, payload: Mapping[str, Any]) -> ScheduleData:
         data = self._validate(payload)
+        self._load_cache = None
         self.schedule_path.parent.mkdir(parents=True, exist_ok=True)
 
         fd, temp_path = tempfile.mkstemp(
@@ -102,11 +123,13 @@ class ScheduleStore:
             suffix=".tmp",
         )
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                json.dump(data.to_dict(), handle, indent=2, sort_keys=True)
-                handle.write("\n")
-                handle.flush()
-                os.fsync(handle.fileno())
+            try:
+                view = memoryview(_encode_schedule(data.to_dict()))
+                while view:
+                    view = view[os.write(fd, view) :]
+                _fdatasync(fd)
+            finally:
+                os.close(fd)
             os.replace(temp_path, self.schedule_path)
         except OSError as exc:
             try:
@@ -159,7 +182,8 @@ class ScheduleStore:
         return ScheduleData(mode=mode, datetime=normalized)
 
 
-CRON_FIELD_PATTERN = re.compile(r"^[\w*/,.-]+$")
+# Five whitespace separated fields; ``\s`` is the whitespace ``str.split`` uses.
+CRON_EXPRESSION_PATTERN = re.compile(r"\s*[\w*/,.-]+(?:\s+[\w*/,.-]+){4}\s*")
 DURATION_PATTERN = re.compile(
     r"^((?:\d+(?:\.\d+)?|\.\d+)(?:ns|us|µs|ms|s|m|h))+"
 )
@@ -176,19 +200,35 @@ DURATION_UNIT_SECONDS = {
     "h": 3600.0,
 }
 
-CRON_MACROS = {
-    "@yearly",
-    "@annually",
-    "@monthly",
-    "@weekly",
-    "@daily",
-    "@midnight",
-    "@hourly",
-    "@reboot",
-}
+CRON_MACROS = frozenset(
+    {
+        "@yearly",
+        "@annually",
+        "@monthly",
+        "@weekly",
+        "@daily",
+        "@midnight",
+        "@hourly",
+        "@reboot",
+    }
+)
+
+
+def _encode_schedule(payload: Mapping[str, Any]) -> bytes:
+    """Serialize ``payload`` as indented JSON with sorted keys."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n"
+    return (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+# Only the file contents must reach the disk before the rename.
+_fdatasync = getattr(os, "fdatasync", os.fsync)
 
 
 def _is_valid_cron(expression: str) -> bool:
+    if not expression.startswith("@"):
+        return CRON_EXPRESSION_PATTERN.fullmatch(expression) is not None
     lowered = expression.lower()
     if lowered.startswith("@every"):
         parts = expression.split(maxsplit=1)
@@ -203,12 +243,8 @@ def _is_valid_cron(expression: str) -> bool:
             unit = match.group("unit")
             total_seconds += value * DURATION_UNIT_SECONDS[unit]
         return total_seconds > 0
-    if lowered in CRON_MACROS:
-        return True
-    parts = [part for part in expression.split() if part]
-    if len(parts) != 5:
-        return False
-    return all(CRON_FIELD_PATTERN.match(part) for part in parts)
+    # ``@`` cannot start a cron field, so anything else is invalid.
+    return lowered in CRON_MACROS
 
 
 def normalize_datetime_utc(value: str) -> datetime:
@@ -223,7 +259,10 @@ def normalize_datetime_utc(value: str) -> datetime:
     return parsed.astimezone(timezone.utc)
 
 
+@functools.lru_cache(maxsize=256)
 def _normalize_datetime(value: str) -> str:
+    # Pure function of ``value``; the same one-shot datetime is normalized
+    # again every time the schedule file is saved or re-read.
     try:
         return normalize_datetime_utc(value).isoformat()
     except ValueError as exc:  # pragma: no cover - sanity guard for unexpected formats
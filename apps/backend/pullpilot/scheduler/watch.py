@@ -1,6 +1,7 @@
 """Watch the shared schedule file and (re)start the runner when it changes."""
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
@@ -251,8 +252,14 @@ class SchedulerWatcher:
                 pass
             else:
                 process.wait()
+
+
+@functools.lru_cache(maxsize=None)
 def _project_root() -> Path:
-    """Return the project root path used for resolving helper resources."""
+    """Return the project root path used for resolving helper resources.
+
+    The location of this module does not change, so ``resolve()`` runs once.
+    """
 
     # ``watch.py`` lives under ``apps/backend/pullpilot/scheduler`` so the
     # repository root sits one level above ``apps``.
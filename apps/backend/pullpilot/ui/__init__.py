@@ -1,5 +1,11 @@
 """Utilities for Pullpilot's UI layer."""
 
-from .logs import LogReadError, MAX_UI_LOG_LINES, gather_logs, read_log_tail
+from .logs import LogReadError, MAX_UI_LOG_LINES, find_log_file, gather_logs, read_log_tail
 
-__all__ = ["LogReadError", "MAX_UI_LOG_LINES", "gather_logs", "read_log_tail"]
+__all__ = [
+    "LogReadError",
+    "MAX_UI_LOG_LINES",
+    "find_log_file",
+    "gather_logs",
+    "read_log_tail",
+]
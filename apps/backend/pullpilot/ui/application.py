@@ -1,18 +1,88 @@
 """FastAPI wiring helpers for the Pullpilot UI."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+from dataclasses import dataclass
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+try:  # pragma: no cover - optional dependency
+    from fastapi import Request
+except ImportError:  # pragma: no cover - optional dependency
+    Request = None  # type: ignore[misc, assignment]
 
 from ..auth import TOKEN_ENV
+from ..config import ConfigError
 from ..resources import get_resource_path, resource_exists
+from .logs import MAX_UI_LOG_LINES, LogReadError
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _ApiRoute:
+    """Authenticated JSON endpoint forwarded to :class:`ConfigAPI`."""
+
+    method: str
+    path: str
+    name: str
+    read_body: bool = False
+    query_fields: Tuple[str, ...] = ()
+    # ``GET /config`` historically returns error bodies verbatim instead of
+    # wrapping them in FastAPI's ``{"detail": ...}`` envelope.
+    raise_errors: bool = True
+
+
+_API_ROUTES: Tuple[_ApiRoute, ...] = (
+    _ApiRoute("GET", "/ui/config", "get_ui_config"),
+    _ApiRoute("POST", "/ui/config", "post_ui_config", read_body=True),
+    _ApiRoute("GET", "/ui/logs", "get_ui_logs", query_fields=("name",)),
+    _ApiRoute("POST", "/ui/logs", "post_ui_logs", read_body=True),
+    _ApiRoute("POST", "/ui/run-test", "post_ui_run_test"),
+    _ApiRoute("GET", "/config", "get_config", raise_errors=False),
+    _ApiRoute("PUT", "/config", "put_config", read_body=True),
+    _ApiRoute("GET", "/schedule", "get_schedule"),
+    _ApiRoute("PUT", "/schedule", "put_schedule", read_body=True),
+)
+
+
+# ``index.html`` contents keyed by path, read on first request and shared by
+# every application configured in the process.
+_UI_INDEX_CACHE: Dict[Path, bytes] = {}
+_UI_INDEX_LOCK = threading.Lock()
+
+
+def _read_ui_index(path: Path) -> bytes:
+    """Return the UI page at ``path`` as UTF-8 bytes, reading it only once."""
+
+    content = _UI_INDEX_CACHE.get(path)
+    if content is None:
+        with _UI_INDEX_LOCK:
+            content = _UI_INDEX_CACHE.get(path)
+            if content is None:
+                # Starlette sends ``bytes`` content as-is, so serving the page
+                # never re-encodes the document.
+                content = path.read_text(encoding="utf-8").encode("utf-8")
+                _UI_INDEX_CACHE[path] = content
+    return content
+
+
+def json_response_class() -> type:
+    """Return ``ORJSONResponse`` when ``orjson`` is installed, else ``JSONResponse``."""
+
+    from fastapi.responses import JSONResponse, ORJSONResponse
+
+    try:  # pragma: no cover - optional dependency
+        import orjson  # noqa: F401
+    except ImportError:  # pragma: no cover - optional dependency
+        return JSONResponse
+    return ORJSONResponse
+
+
 def _iter_ui_source_candidates() -> tuple[Path, ...]:
     """Return possible source directories for the unbundled UI."""
 
@@ -33,16 +103,19 @@ def _iter_ui_source_candidates() -> tuple[Path, ...]:
 def configure_application(app: Any, api: Any) -> None:
     """Configure FastAPI routes and assets for the UI."""
 
-    from fastapi import Depends, HTTPException, Request
+    # ``Request`` is imported at module level: FastAPI resolves the postponed
+    # endpoint annotations against the module globals.
+    from fastapi import Depends, HTTPException, Query
     from fastapi.responses import (
         FileResponse,
         HTMLResponse,
-        JSONResponse,
         RedirectResponse,
         Response,
     )
     from fastapi.staticfiles import StaticFiles
 
+    response_class = json_response_class()
+
     ui_root_dir: Optional[Path] = None
     ui_dist_dir: Optional[Path] = None
     has_built_assets = False
@@ -88,7 +161,6 @@ def configure_application(app: Any, api: Any) -> None:
             "UI assets are missing; run 'npm run build' or install the source tree"
         )
 
-    ui_index_content = ui_index_path.read_text(encoding="utf-8")
     ui_styles_path = ui_source_styles_path if ui_source_styles_path.exists() else None
     ui_script_path = ui_source_script_path if ui_source_script_path.exists() else None
 
@@ -104,30 +176,35 @@ def configure_application(app: Any, api: Any) -> None:
 
     if ui_manifest_path and ui_manifest_path.exists():
         @app.get("/ui/manifest.json")
-        def get_ui_manifest() -> FileResponse:  # pragma: no cover - FastAPI runtime
+        async def get_ui_manifest() -> FileResponse:  # pragma: no cover - FastAPI runtime
             return FileResponse(ui_manifest_path, media_type="application/json")
 
+    # These handlers only build responses (``FileResponse`` streams the file
+    # itself), so they run on the event loop instead of the threadpool.
     @app.get("/", include_in_schema=False)
-    def redirect_root_to_ui() -> RedirectResponse:  # pragma: no cover - FastAPI runtime
+    async def redirect_root_to_ui() -> RedirectResponse:  # pragma: no cover - FastAPI runtime
         return RedirectResponse("/ui/", status_code=HTTPStatus.TEMPORARY_REDIRECT)
 
     @app.get("/ui", include_in_schema=False)
-    def redirect_ui() -> RedirectResponse:  # pragma: no cover - FastAPI runtime
+    async def redirect_ui() -> RedirectResponse:  # pragma: no cover - FastAPI runtime
         return RedirectResponse("/ui/", status_code=HTTPStatus.TEMPORARY_REDIRECT)
 
     if ui_styles_path:
         @app.get("/ui/styles.css")
-        def get_ui_styles() -> FileResponse:  # pragma: no cover - FastAPI runtime
+        async def get_ui_styles() -> FileResponse:  # pragma: no cover - FastAPI runtime
             return FileResponse(ui_styles_path, media_type="text/css")
 
     if ui_script_path:
         @app.get("/ui/app.js")
-        def get_ui_script() -> FileResponse:  # pragma: no cover - FastAPI runtime
+        async def get_ui_script() -> FileResponse:  # pragma: no cover - FastAPI runtime
             return FileResponse(ui_script_path, media_type="application/javascript")
 
     @app.get("/ui/", response_class=HTMLResponse)
-    def get_ui_page() -> HTMLResponse:  # pragma: no cover - FastAPI runtime
-        return HTMLResponse(ui_index_content)
+    async def get_ui_page() -> HTMLResponse:  # pragma: no cover - FastAPI runtime
+        content = _UI_INDEX_CACHE.get(ui_index_path)
+        if content is None:
+            content = await _dispatch(_read_ui_index, ui_index_path)
+        return HTMLResponse(content)
 
     async def _require_auth(request: Request) -> None:
         authenticator = api.authenticator
@@ -143,87 +220,68 @@ def configure_application(app: Any, api: Any) -> None:
             return
         raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail={"error": "unauthorized"})
 
-    @app.get("/ui/config", dependencies=[Depends(_require_auth)])
-    def get_ui_config(request: Request):  # pragma: no cover - FastAPI runtime
-        status, body = api.handle_request("GET", "/ui/config", headers=request.headers)
-        if status != HTTPStatus.OK:
-            raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body, status_code=status)
+    async def _dispatch(handler: Callable[..., Any], *args: Any) -> Any:
+        # Blocking store and subprocess work runs on the bounded API executor so
+        # the routes never stall the event loop.
+        executor = getattr(app.state, "executor", None)
+        return await asyncio.get_running_loop().run_in_executor(executor, handler, *args)
 
-    @app.get("/ui/auth-check", dependencies=[Depends(_require_auth)])
-    def get_ui_auth_check(request: Request):  # pragma: no cover - FastAPI runtime
-        status, body = api.handle_request("GET", "/ui/auth-check", headers=request.headers)
-        if status == HTTPStatus.NO_CONTENT:
-            return Response(status_code=status)
-        if status != HTTPStatus.OK:
+    def _respond(status: int, body: Any, raise_errors: bool) -> Response:
+        if raise_errors and status != HTTPStatus.OK:
             raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body, status_code=status)
+        return response_class(body, status_code=status)
+
+    def _make_endpoint(route: _ApiRoute) -> Callable[..., Any]:
+        method, path, raise_errors = route.method, route.path, route.raise_errors
+        if route.read_body:
+            async def endpoint(request: Request):  # pragma: no cover - FastAPI runtime
+                status, body = await _dispatch(
+                    api._dispatch_authenticated_bytes, method, path, await request.body()
+                )
+                return _respond(status, body, raise_errors)
+        else:
+            query_fields = route.query_fields
 
-    @app.post("/ui/config", dependencies=[Depends(_require_auth)])
-    async def post_ui_config(request: Request):  # pragma: no cover - FastAPI runtime
-        payload = await request.json()
-        status, body = api.handle_request(
-            "POST", "/ui/config", payload, request.headers
-        )
-        if status != HTTPStatus.OK:
-            raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body, status_code=status)
-
-    @app.get("/ui/logs", dependencies=[Depends(_require_auth)])
-    def get_ui_logs(request: Request):  # pragma: no cover - FastAPI runtime
-        name = request.query_params.get("name")
-        payload = {"name": name} if name is not None else None
-        status, body = api.handle_request(
-            "GET", "/ui/logs", payload, request.headers
-        )
-        if status != HTTPStatus.OK:
-            raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body, status_code=status)
+            async def endpoint(request: Request):  # pragma: no cover - FastAPI runtime
+                params = request.query_params
+                payload = {field: params[field] for field in query_fields if field in params}
+                status, body = await _dispatch(
+                    api._dispatch_authenticated, method, path, payload or None
+                )
+                return _respond(status, body, raise_errors)
 
-    @app.post("/ui/logs", dependencies=[Depends(_require_auth)])
-    async def post_ui_logs(request: Request):  # pragma: no cover - FastAPI runtime
-        payload = await request.json()
-        status, body = api.handle_request(
-            "POST", "/ui/logs", payload, request.headers
-        )
-        if status != HTTPStatus.OK:
-            raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body, status_code=status)
+        return endpoint
 
-    @app.post("/ui/run-test", dependencies=[Depends(_require_auth)])
-    async def post_ui_run_test(request: Request):  # pragma: no cover - FastAPI runtime
-        status, body = api.handle_request("POST", "/ui/run-test", headers=request.headers)
-        if status != HTTPStatus.OK:
-            raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body, status_code=status)
-
-    @app.get("/config", dependencies=[Depends(_require_auth)])
-    def get_config(request: Request):  # pragma: no cover - FastAPI runtime
-        status, body = api.handle_request("GET", "/config", headers=request.headers)
-        return JSONResponse(body, status_code=status)
-
-    @app.put("/config", dependencies=[Depends(_require_auth)])
-    async def put_config(request: Request):  # pragma: no cover - FastAPI runtime
-        payload = await request.json()
-        status, body = api.handle_request("PUT", "/config", payload, request.headers)
-        if status != HTTPStatus.OK:
-            raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body)
-
-    @app.get("/schedule", dependencies=[Depends(_require_auth)])
-    def get_schedule(request: Request):  # pragma: no cover - FastAPI runtime
-        status, body = api.handle_request("GET", "/schedule", headers=request.headers)
-        if status != HTTPStatus.OK:
-            raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body, status_code=status)
-
-    @app.put("/schedule", dependencies=[Depends(_require_auth)])
-    async def put_schedule(request: Request):  # pragma: no cover - FastAPI runtime
-        payload = await request.json()
-        status, body = api.handle_request("PUT", "/schedule", payload, request.headers)
-        if status != HTTPStatus.OK:
-            raise HTTPException(status_code=status, detail=body)
-        return JSONResponse(body)
+    @app.get("/ui/auth-check", dependencies=[Depends(_require_auth)])
+    async def get_ui_auth_check() -> Response:  # pragma: no cover - FastAPI runtime
+        # ``_require_auth`` already validated the token; nothing left to dispatch.
+        return Response(status_code=HTTPStatus.NO_CONTENT)
+
+    @app.get("/ui/logs/content", dependencies=[Depends(_require_auth)])
+    async def get_ui_log_content(  # pragma: no cover - FastAPI runtime
+        name: str, tail: int = Query(MAX_UI_LOG_LINES, ge=1, le=MAX_UI_LOG_LINES)
+    ) -> Response:
+        # Plain-text tail of a single log, without the JSON escaping of ``/ui/logs``.
+        try:
+            content = await _dispatch(api.read_log_content, name, tail)
+        except (ConfigError, LogReadError) as exc:
+            _LOGGER.warning("Failed to read log content for '%s'", name, exc_info=True)
+            raise HTTPException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail={"error": "failed to load logs", "details": str(exc)},
+            ) from exc
+        if content is None:
+            raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail={"error": "not found"})
+        return Response(content.encode("utf-8"), media_type="text/plain; charset=utf-8")
+
+    for route in _API_ROUTES:
+        app.add_api_route(
+            route.path,
+            _make_endpoint(route),
+            methods=[route.method],
+            name=route.name,
+            dependencies=[Depends(_require_auth)],
+        )
 
     def handle_request(
         method: str,
@@ -3,18 +3,22 @@ from __future__ import annotations
 
 import bz2
 import gzip
+import io
 import logging
 import lzma
+import os
 import re
+import stat
 from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
-from ..config import ConfigStore
+from ..config import ConfigData, ConfigStore
 
 LOGGER = logging.getLogger("pullpilot.ui.logs")
 
 MAX_UI_LOG_LINES = 400
+_TAIL_CHUNK_SIZE = 64 * 1024
 
 _COMPRESSED_OPENERS = {
     ".gz": gzip.open,
@@ -48,22 +52,70 @@ class LogReadError(RuntimeError):
     """Raised when a log file cannot be read."""
 
 
-def gather_logs(store: ConfigStore, selected_name: Optional[str] = None) -> Dict[str, object]:
-    """Return UI payload with the log directory contents."""
-
-    data = store.load()
+def _log_dir_setting(data: ConfigData) -> str:
     log_dir_raw = data.values.get("LOG_DIR", "")
-    log_dir_str = str(log_dir_raw).strip() if log_dir_raw is not None else ""
+    return str(log_dir_raw).strip() if log_dir_raw is not None else ""
+
+
+def _expand_log_dir(log_dir_str: str) -> Path:
+    try:
+        return Path(log_dir_str).expanduser()
+    except Exception:
+        return Path(log_dir_str)
+
+
+def _probe_log_file(log_dir_path: Path, name: str) -> Optional[os.stat_result]:
+    """Return the ``stat`` of log ``name`` inside ``log_dir_path`` or ``None``."""
+
+    if os.sep in name or "/" in name or "\x00" in name:
+        return None
+    if not _LOG_FILE_PATTERN.search(name):
+        return None
+    try:
+        file_stat = (log_dir_path / name).stat()
+    except OSError:
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
+def _selected_log_payload(
+    log_dir_path: Path, name: str, file_payload: Dict[str, object]
+) -> Tuple[Dict[str, object], Optional[str]]:
+    selected_payload = dict(file_payload)
+    selected_path = log_dir_path / name
+    try:
+        content = read_log_tail(selected_path)
+    except LogReadError as exc:
+        LOGGER.warning("Failed to read log '%s': %s", selected_path, exc, exc_info=True)
+        notice_message = f"No se pudo leer el archivo de log '{name}': {exc}"
+        selected_payload["content"] = ""
+        selected_payload["notice"] = notice_message
+        return selected_payload, notice_message
+    selected_payload["content"] = content
+    return selected_payload, None
+
+
+def gather_logs(
+    store: ConfigStore,
+    selected_name: Optional[str] = None,
+    *,
+    config: Optional[ConfigData] = None,
+) -> Dict[str, object]:
+    """Return UI payload with the log directory contents.
+
+    ``config`` skips ``store.load()`` when the caller already holds the
+    current configuration.
+    """
+
+    data = config if config is not None else store.load()
+    log_dir_str = _log_dir_setting(data)
     if not log_dir_str:
         return _empty_directory_payload(
             "",
             "LOG_DIR no está configurado. Define un directorio absoluto para poder consultar los logs.",
         )
 
-    try:
-        log_dir_path = Path(log_dir_str).expanduser()
-    except Exception:
-        log_dir_path = Path(log_dir_str)
+    log_dir_path = _expand_log_dir(log_dir_str)
 
     if not log_dir_path.exists() or not log_dir_path.is_dir():
         return _empty_directory_payload(
@@ -77,7 +129,7 @@ def gather_logs(store: ConfigStore, selected_name: Optional[str] = None) -> Dict
 
     entries = []
     try:
-        iterator = log_dir_path.iterdir()
+        scanner = os.scandir(log_dir_path)
     except (OSError, PermissionError) as exc:
         LOGGER.warning(
             "Failed to list log directory '%s': %s", log_dir_path, exc, exc_info=True
@@ -87,50 +139,45 @@ def gather_logs(store: ConfigStore, selected_name: Optional[str] = None) -> Dict
             f"No se pudo listar el directorio de logs '{log_dir_str}': {exc}",
         )
 
-    for entry in iterator:
-        if not entry.is_file() or not _LOG_FILE_PATTERN.search(entry.name):
-            continue
-        try:
-            file_stat = entry.stat()
-        except OSError as exc:
-            LOGGER.warning("Failed to stat log '%s': %s", entry, exc, exc_info=True)
-            continue
-        entries.append((entry, file_stat))
+    # ``DirEntry`` carries the file type from the directory read, so non-log
+    # entries are filtered without an extra stat call each.
+    with scanner:
+        for entry in scanner:
+            if not _LOG_FILE_PATTERN.search(entry.name):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                file_stat = entry.stat()
+            except OSError as exc:
+                LOGGER.warning("Failed to stat log '%s': %s", entry.path, exc, exc_info=True)
+                continue
+            entries.append((entry.name, file_stat))
 
     entries.sort(key=lambda item: item[1].st_mtime, reverse=True)
 
     if not entries:
         notice_message = "No se encontraron archivos de log en el directorio configurado."
 
-    for entry, file_stat in entries:
-        file_payload: Dict[str, object] = {
-            "name": entry.name,
+    # Without an explicit selection the newest log is shown; an unknown name
+    # selects nothing.
+    target_name = selected_name or (entries[0][0] if entries else None)
+    for name, file_stat in entries:
+        file_payload = {
+            "name": name,
             "size": file_stat.st_size,
             "modified": file_stat.st_mtime,
         }
         files_payload.append(file_payload)
 
-        should_select = False
-        if selected_name:
-            should_select = selected_payload is None and entry.name == selected_name
-        else:
-            should_select = selected_payload is None
-
-        if not should_select:
+        if selected_payload is not None or name != target_name:
             continue
 
-        selected_payload = dict(file_payload)
-        try:
-            content = read_log_tail(entry)
-        except LogReadError as exc:
-            LOGGER.warning("Failed to read log '%s': %s", entry, exc, exc_info=True)
-            notice_message = f"No se pudo leer el archivo de log '{entry.name}': {exc}"
-            selected_payload["content"] = ""
-            selected_payload["notice"] = notice_message
-        else:
-            selected_payload["content"] = content
+        selected_payload, read_notice = _selected_log_payload(log_dir_path, name, file_payload)
+        if read_notice:
+            notice_message = read_notice
 
-    result: Dict[str, object] = {
+    result = {
         "log_dir": str(log_dir_path),
         "files": files_payload,
         "selected": selected_payload,
@@ -142,6 +189,21 @@ def gather_logs(store: ConfigStore, selected_name: Optional[str] = None) -> Dict
     return result
 
 
+def find_log_file(
+    store: ConfigStore, name: str, *, config: Optional[ConfigData] = None
+) -> Optional[Path]:
+    """Return the path of log ``name`` inside ``LOG_DIR`` or ``None`` when absent."""
+
+    data = config if config is not None else store.load()
+    log_dir_str = _log_dir_setting(data)
+    if not log_dir_str:
+        return None
+    log_dir_path = _expand_log_dir(log_dir_str)
+    if _probe_log_file(log_dir_path, name) is None:
+        return None
+    return log_dir_path / name
+
+
 def read_log_tail(path: Path, max_lines: int = MAX_UI_LOG_LINES) -> str:
     """Return the last ``max_lines`` lines from ``path`` handling compression."""
 
@@ -156,7 +218,10 @@ def read_log_tail(path: Path, max_lines: int = MAX_UI_LOG_LINES) -> str:
             with opener(path, "rt", encoding="utf-8", errors="replace") as handle:
                 lines = deque(handle, maxlen=max_lines)
         else:
-            with path.open("r", encoding="utf-8", errors="replace") as handle:
+            with path.open("rb") as raw_handle:
+                if raw_handle.seekable():
+                    return _read_seekable_tail(raw_handle, max_lines)
+                handle = io.TextIOWrapper(raw_handle, encoding="utf-8", errors="replace")
                 lines = deque(handle, maxlen=max_lines)
     except (OSError, EOFError, gzip.BadGzipFile, lzma.LZMAError) as exc:
         raise LogReadError(str(exc)) from exc
@@ -164,4 +229,41 @@ def read_log_tail(path: Path, max_lines: int = MAX_UI_LOG_LINES) -> str:
     return "".join(lines)
 
 
-__all__ = ["LogReadError", "MAX_UI_LOG_LINES", "gather_logs", "read_log_tail"]
+def _read_seekable_tail(handle: BinaryIO, max_lines: int) -> str:
+    """Read backwards from the end of ``handle`` until ``max_lines`` are covered.
+
+    Only the trailing chunks holding the requested lines are read, so large
+    logs cost roughly the size of their tail instead of the whole file. The
+    result matches iterating the file in text mode (universal newlines).
+    """
+
+    if max_lines <= 0:
+        return ""
+    position = handle.seek(0, os.SEEK_END)
+    chunks: List[bytes] = []
+    newlines = 0
+    # One extra newline guarantees the first, possibly partial, line is dropped.
+    while position > 0 and newlines <= max_lines:
+        size = min(_TAIL_CHUNK_SIZE, position)
+        position -= size
+        handle.seek(position)
+        chunk = handle.read(size)
+        chunks.append(chunk)
+        newlines += chunk.count(b"\n")
+    chunks.reverse()
+    text = b"".join(chunks).decode("utf-8", errors="replace")
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    parts = text.split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return "".join(lines[-max_lines:])
+
+
+__all__ = [
+    "LogReadError",
+    "MAX_UI_LOG_LINES",
+    "find_log_file",
+    "gather_logs",
+    "read_log_tail",
+]
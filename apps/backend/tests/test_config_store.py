@@ -6,7 +6,7 @@ import pytest
 
 from pullpilot.api import ConfigAPI
 from pullpilot.auth import Authenticator
-from pullpilot.config import ConfigStore, PersistenceError, ValidationError
+from pullpilot.config import ConfigError, ConfigStore, PersistenceError, ValidationError
 from pullpilot.schedule import ScheduleStore
 
 
@@ -35,6 +35,89 @@ def test_load_defaults_when_config_missing(tmp_path: Path, schema_path: Path) ->
     assert data.values["SMTP_READ_ENVELOPE"] is True
 
 
+def test_schema_overview_is_built_once(tmp_path: Path, schema_path: Path) -> None:
+    store = ConfigStore(tmp_path / "updater.conf", schema_path)
+
+    overview = store.schema_overview()
+
+    assert store.schema_overview() is overview
+    assert [entry["name"] for entry in overview["variables"]] == store.schema_order
+    assert store.multiline_fields == []
+    store.multiline_fields.append("BASE_DIR")
+    assert store.multiline_fields == []
+
+
+def test_schema_patterns_are_compiled_on_load(tmp_path: Path) -> None:
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        '{"variables": [{"name": "TAG", "type": "string", "default": "v1",'
+        ' "constraints": {"pattern": "^v[0-9]+$"}}]}',
+        encoding="utf-8",
+    )
+    store = ConfigStore(tmp_path / "updater.conf", schema)
+
+    assert store.schema_map["TAG"].pattern_re is not None
+    assert store._check_constraints(store.schema_map["TAG"], "v2") is None
+    assert store._check_constraints(store.schema_map["TAG"], "2") == (
+        "value must match pattern '^v[0-9]+$'"
+    )
+    assert store.schema_overview()["variables"][0]["constraints"] == {"pattern": "^v[0-9]+$"}
+
+    schema.write_text(
+        '{"variables": [{"name": "TAG", "type": "string", "constraints": {"pattern": "("}}]}',
+        encoding="utf-8",
+    )
+    with pytest.raises(ConfigError, match="bad pattern for 'TAG'"):
+        ConfigStore(tmp_path / "updater.conf", schema)
+
+
+def test_schema_is_shared_between_stores_until_it_changes(tmp_path: Path) -> None:
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        '{"variables": [{"name": "TAG", "type": "string", "default": "v1"}]}',
+        encoding="utf-8",
+    )
+    first = ConfigStore(tmp_path / "a.conf", schema)
+    second = ConfigStore(tmp_path / "b.conf", schema)
+
+    assert second.schema_map["TAG"] is first.schema_map["TAG"]
+
+    schema.write_text(
+        '{"variables": [{"name": "TAG", "type": "string", "default": "v22"}]}',
+        encoding="utf-8",
+    )
+    third = ConfigStore(tmp_path / "c.conf", schema)
+
+    assert third.schema_map["TAG"].default == "v22"
+    assert first.schema_map["TAG"].default == "v1"
+
+
+def test_document_is_reparsed_only_when_file_changes(
+    tmp_path: Path, schema_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "updater.conf"
+    config_path.write_text('LOG_DIR="/var/log/a"\n', encoding="utf-8")
+    store = ConfigStore(config_path, schema_path)
+    parse_calls = []
+    original_parse = store._parse_document
+
+    def counting_parse():  # type: ignore[no-untyped-def]
+        parse_calls.append(1)
+        return original_parse()
+
+    monkeypatch.setattr(store, "_parse_document", counting_parse)
+
+    assert store.load().values["LOG_DIR"] == "/var/log/a"
+    document = store._read_document()
+    document[0].value = "/changed"
+    assert store.load().values["LOG_DIR"] == "/var/log/a"
+    assert len(parse_calls) == 1
+
+    config_path.write_text('LOG_DIR="/var/log/bb"\n', encoding="utf-8")
+    assert store.load().values["LOG_DIR"] == "/var/log/bb"
+    assert len(parse_calls) == 2
+
+
 def test_roundtrip_preserves_comments_and_quotes(tmp_path: Path, schema_path: Path) -> None:
     config_text = (
         "# sample configuration\n"
@@ -143,6 +226,43 @@ def test_validation_error_collects_all_fields(tmp_path: Path, schema_path: Path)
     assert "LOG_RETENTION_DAYS" in messages
 
 
+def test_save_skips_write_when_values_are_unchanged(
+    tmp_path: Path, schema_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ConfigStore(tmp_path / "updater.conf", schema_path)
+    values = store.load().values.copy()
+    ensure_required_paths(values, tmp_path)
+    store.save(values)
+
+    writes = []
+    original_write = store._write_document
+    monkeypatch.setattr(store, "_write_document", lambda document: writes.append(document))
+
+    assert store.save(values).values == values
+    assert writes == []
+
+    values["LOG_RETENTION_DAYS"] = 30
+    monkeypatch.setattr(store, "_write_document", original_write)
+    assert store.save(values).values["LOG_RETENTION_DAYS"] == 30
+
+
+def test_write_document_leaves_identical_file_in_place(
+    tmp_path: Path, schema_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "updater.conf"
+    config_path.write_text('LOG_DIR="/var/log/a"\n', encoding="utf-8")
+    store = ConfigStore(config_path, schema_path)
+
+    def fail_mkstemp(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("unexpected write")
+
+    monkeypatch.setattr("pullpilot.config.tempfile.mkstemp", fail_mkstemp)
+
+    store._write_document(store._read_document())
+
+    assert config_path.read_text(encoding="utf-8") == 'LOG_DIR="/var/log/a"\n'
+
+
 def test_save_does_not_truncate_config_when_write_fails(
     tmp_path: Path, schema_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
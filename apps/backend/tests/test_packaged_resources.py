@@ -1,3 +1,4 @@
+import asyncio
 from http import HTTPStatus
 from importlib import resources
 from pathlib import Path
@@ -130,13 +131,13 @@ def test_configure_application_falls_back_when_bundle_missing(monkeypatch, tmp_p
     assert not asset_mounts, "packaged assets should not be mounted when the bundle is missing"
 
     ui_page = next(route for route in app.routes if getattr(route, "path", None) == "/ui/")
-    response = ui_page.endpoint()
+    response = asyncio.run(ui_page.endpoint())
     assert response.body.decode("utf-8") == index_html
 
     styles_route = next(route for route in app.routes if getattr(route, "path", None) == "/ui/styles.css")
-    styles_response = styles_route.endpoint()
+    styles_response = asyncio.run(styles_route.endpoint())
     assert Path(styles_response.path) == src_dir / "styles.css"
 
     script_route = next(route for route in app.routes if getattr(route, "path", None) == "/ui/app.js")
-    script_response = script_route.endpoint()
+    script_response = asyncio.run(script_route.endpoint())
     assert Path(script_response.path) == src_dir / "app.js"
@@ -159,3 +159,80 @@ def test_cached_directory_reused_when_unmodified(tmp_path: Path, monkeypatch: py
     assert cached_file_path.exists()
     assert cached_file_path.read_text() == "original"
     assert copy_calls == 1
+
+
+def test_validated_directory_skips_rescanning_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    package_root = tmp_path / "package"
+    origin_dir = package_root / "data"
+    origin_dir.mkdir(parents=True)
+    (origin_dir / "example.txt").write_text("original")
+
+    cache_root = tmp_path / "cache"
+
+    class DummyResources:
+        @staticmethod
+        def files(name: str) -> Path:
+            assert name == resources_module.__name__
+            return package_root
+
+        @staticmethod
+        @contextlib.contextmanager
+        def as_file(traversable: Path):
+            yield traversable
+
+    monkeypatch.setattr(resources_module, "resources", DummyResources)
+    monkeypatch.setattr(resources_module, "_CACHE_DIR", cache_root)
+
+    cached_dir_path = get_resource_path("data")
+
+    scanned = []
+    original_snapshot = resources_module._snapshot_directory
+
+    def recording_snapshot(base: Path):
+        scanned.append(base)
+        return original_snapshot(base)
+
+    monkeypatch.setattr(resources_module, "_snapshot_directory", recording_snapshot)
+
+    assert get_resource_path("data") == cached_dir_path
+    assert scanned == [origin_dir]
+
+    scanned.clear()
+    resources_module.invalidate_resource_cache("data")
+    assert get_resource_path("data") == cached_dir_path
+    assert scanned == [origin_dir, cached_dir_path]
+
+
+def test_copy_directory_copies_every_nested_file(tmp_path: Path):
+    source = tmp_path / "source"
+    expected = {}
+    for relative in ("a.txt", "b.txt", "nested/c.txt", "nested/deeper/d.txt"):
+        path = source / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative)
+        expected[relative] = relative
+    (source / "empty").mkdir()
+
+    destination = tmp_path / "destination"
+    resources_module._copy_directory(source, destination)
+
+    copied = {
+        path.relative_to(destination).as_posix(): path.read_text()
+        for path in destination.rglob("*")
+        if path.is_file()
+    }
+    assert copied == expected
+    assert (destination / "empty").is_dir()
+
+
+def test_resource_tree_present_compares_packaged_names(tmp_path: Path):
+    config_dir = tmp_path / "config"
+    assert not resources_module.resource_tree_present("config", config_dir)
+
+    config_dir.mkdir()
+    for name in ("pullpilot.schedule", "updater.conf", "schema.json"):
+        (config_dir / name).write_text("")
+    assert resources_module.resource_tree_present("config", config_dir)
+
+    (config_dir / "schema.json").unlink()
+    assert not resources_module.resource_tree_present("config", config_dir)
@@ -34,6 +34,34 @@ def test_save_and_reload_cron(schedule_path: Path) -> None:
     assert reloaded.expression == "15 6 * * 2"
 
 
+def test_load_reuses_parsed_schedule_until_file_changes(
+    schedule_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    schedule_path.write_text(
+        json.dumps({"mode": "cron", "expression": "15 6 * * 2"}), encoding="utf-8"
+    )
+    store = ScheduleStore(schedule_path)
+    parsed = []
+    original_loads = json.loads
+
+    def counting_loads(raw, *args, **kwargs):  # type: ignore[no-untyped-def]
+        parsed.append(raw)
+        return original_loads(raw, *args, **kwargs)
+
+    monkeypatch.setattr("pullpilot.schedule.json.loads", counting_loads)
+
+    first = store.load()
+    first.expression = "mutated"
+    assert store.load().expression == "15 6 * * 2"
+    assert len(parsed) == 1
+
+    schedule_path.write_text(
+        json.dumps({"mode": "cron", "expression": "30 7 * * 3"}), encoding="utf-8"
+    )
+    assert store.load().expression == "30 7 * * 3"
+    assert len(parsed) == 2
+
+
 def test_save_accepts_macros(schedule_path: Path) -> None:
     store = ScheduleStore(schedule_path)
     saved = store.save({"mode": "cron", "expression": "@hourly"})
@@ -94,7 +122,7 @@ def test_save_preserves_existing_file_on_write_failure(
     def explode(*args, **kwargs):  # type: ignore[no-untyped-def]
         raise RuntimeError("boom")
 
-    monkeypatch.setattr("pullpilot.schedule.json.dump", explode)
+    monkeypatch.setattr("pullpilot.schedule._encode_schedule", explode)
 
     with pytest.raises(RuntimeError):
         store.save({"mode": "cron", "expression": "10 5 * * 1"})
@@ -22,6 +22,7 @@ from pullpilot.auth import (
 )
 from pullpilot.config import ConfigError, ConfigStore
 from pullpilot.schedule import ScheduleStore
+from pullpilot.ui import MAX_UI_LOG_LINES
 
 @pytest.fixture()
 def store(tmp_path: Path) -> ConfigStore:
@@ -232,6 +233,35 @@ def test_get_includes_schema_metadata(
     assert body.get("meta", {}).get("multiline_fields") == []
 
 
+def test_get_reuses_loaded_config_until_file_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    auth_headers: Mapping[str, str],
+    store: ConfigStore,
+    schedule_store: ScheduleStore,
+) -> None:
+    store.config_path.write_text('LOG_DIR="/var/log/a"\n', encoding="utf-8")
+    api = ConfigAPI(store=store, schedule_store=schedule_store)
+    original_load = store.load
+    calls = []
+
+    def counting_load():  # type: ignore[no-untyped-def]
+        calls.append(1)
+        return original_load()
+
+    monkeypatch.setattr(store, "load", counting_load)
+
+    for _ in range(2):
+        status, body = api.handle_request("GET", "/config", headers=auth_headers)
+        assert status == HTTPStatus.OK
+        assert body["values"]["LOG_DIR"] == "/var/log/a"
+    assert len(calls) == 1
+
+    store.config_path.write_text('LOG_DIR="/var/log/bb"\n', encoding="utf-8")
+    status, body = api.handle_request("GET", "/config", headers=auth_headers)
+    assert body["values"]["LOG_DIR"] == "/var/log/bb"
+    assert len(calls) == 2
+
+
 def test_get_returns_error_when_store_load_fails(
     monkeypatch: pytest.MonkeyPatch,
     auth_headers: Mapping[str, str],
@@ -680,6 +710,25 @@ def test_authenticator_ignores_wrapping_quotes_in_token(
     assert authenticator.token == "secreto"
 
 
+def test_authenticator_tracks_token_updates() -> None:
+    authenticator = Authenticator(token="first")
+    assert authenticator.authorize({"Authorization": "Bearer first"})
+    assert authenticator.authorize({"Authorization": "bearer first"})
+
+    authenticator.token = "second"
+    assert not authenticator.authorize({"Authorization": "Bearer first"})
+    assert authenticator.authorize({"Authorization": "Token second"})
+
+    authenticator.token = None
+    assert not authenticator.authorize({"Authorization": "Bearer second"})
+
+
+def test_authenticator_rejects_non_ascii_tokens_without_error() -> None:
+    authenticator = Authenticator(token="contraseña")
+    assert authenticator.authorize({"Authorization": "bearer contraseña"})
+    assert not authenticator.authorize({"Authorization": "Bearer señal"})
+
+
 @pytest.mark.skipif(os.name == "nt", reason="POSIX file permissions not supported on Windows")
 def test_authenticator_loads_token_from_file(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -872,6 +921,43 @@ def test_schedule_put_returns_persistence_errors(
     assert detail["errno"] == errno.EACCES
 
 
+def test_schedule_put_accepts_raw_json_body(
+    auth_headers: Mapping[str, str], schedule_store: ScheduleStore, store: ConfigStore
+) -> None:
+    api = ConfigAPI(store=store, schedule_store=schedule_store)
+    status, body = api.handle_request_bytes(
+        "PUT",
+        "/schedule",
+        b'{"mode": "cron", "expression": "45 3 * * *"}',
+        headers=auth_headers,
+    )
+    assert status == HTTPStatus.OK
+    assert body["expression"] == "45 3 * * *"
+    assert schedule_store.load().expression == "45 3 * * *"
+
+
+def test_raw_json_body_is_rejected_when_invalid(
+    auth_headers: Mapping[str, str], schedule_store: ScheduleStore, store: ConfigStore
+) -> None:
+    api = ConfigAPI(store=store, schedule_store=schedule_store)
+
+    status, body = api.handle_request_bytes("PUT", "/schedule", b"{not json", headers=auth_headers)
+    assert status == HTTPStatus.BAD_REQUEST
+    assert body["error"] == "invalid JSON payload"
+
+    status, body = api.handle_request_bytes("PUT", "/schedule", b"", headers=auth_headers)
+    assert status == HTTPStatus.BAD_REQUEST
+    assert body == {"error": "missing payload"}
+
+    status, body = api.handle_request_bytes("PUT", "/config", b"[]", headers=auth_headers)
+    assert status == HTTPStatus.BAD_REQUEST
+    assert body == {"error": "payload must be an object"}
+
+    status, body = api.handle_request_bytes("PUT", "/schedule", b"{not json")
+    assert status == HTTPStatus.UNAUTHORIZED
+    assert body["error"] == "unauthorized"
+
+
 def test_fastapi_get_propagates_error(
     monkeypatch: pytest.MonkeyPatch,
     store: ConfigStore,
@@ -881,20 +967,19 @@ def test_fastapi_get_propagates_error(
     pytest.importorskip("httpx")
     from fastapi.testclient import TestClient
 
-    original_handle_request = ConfigAPI.handle_request
+    original_dispatch = ConfigAPI._dispatch_authenticated
 
-    def fake_handle_request(
+    def fake_dispatch(
         self: ConfigAPI,
         method: str,
         path: str,
         payload=None,
-        headers=None,
     ):
         if method == "GET" and path == "/config":
             return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "boom"}
-        return original_handle_request(self, method, path, payload, headers)
+        return original_dispatch(self, method, path, payload)
 
-    monkeypatch.setattr(ConfigAPI, "handle_request", fake_handle_request)
+    monkeypatch.setattr(ConfigAPI, "_dispatch_authenticated", fake_dispatch)
 
     monkeypatch.setenv("PULLPILOT_TOKEN", "fast-error")
     app = create_app(store=store, schedule_store=schedule_store)
@@ -953,6 +1038,105 @@ def test_fastapi_ui_routes_require_auth(
     assert client.get("/ui/logs", headers=headers).status_code == HTTPStatus.OK
 
 
+def test_fastapi_ui_auth_check_returns_no_content(
+    monkeypatch: pytest.MonkeyPatch, store: ConfigStore, schedule_store: ScheduleStore
+) -> None:
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("PULLPILOT_TOKEN", "fast-check")
+
+    app = create_app(store=store, schedule_store=schedule_store)
+    client = TestClient(app)
+
+    assert client.get("/ui/auth-check").status_code == HTTPStatus.UNAUTHORIZED
+
+    response = client.get("/ui/auth-check", headers={"Authorization": "Bearer fast-check"})
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert response.content == b""
+
+
+def test_fastapi_ui_log_content_returns_plain_text(
+    monkeypatch: pytest.MonkeyPatch,
+    store: ConfigStore,
+    schedule_store: ScheduleStore,
+    tmp_path: Path,
+) -> None:
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("PULLPILOT_TOKEN", "log-content")
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / "updater.log").write_text("uno\ndos\n", encoding="utf-8")
+    config = store.load()
+    config.values["LOG_DIR"] = str(log_dir)
+    monkeypatch.setattr(store, "load", lambda: config)
+
+    client = TestClient(create_app(store=store, schedule_store=schedule_store))
+    headers = {"Authorization": "Bearer log-content"}
+
+    assert client.get("/ui/logs/content", params={"name": "updater.log"}).status_code == (
+        HTTPStatus.UNAUTHORIZED
+    )
+
+    response = client.get("/ui/logs/content", params={"name": "updater.log"}, headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text == "uno\ndos\n"
+
+    tail = client.get(
+        "/ui/logs/content", params={"name": "updater.log", "tail": 1}, headers=headers
+    )
+    assert tail.status_code == HTTPStatus.OK
+    assert tail.text == "dos\n"
+
+    for bad_tail in (0, MAX_UI_LOG_LINES + 1):
+        rejected = client.get(
+            "/ui/logs/content", params={"name": "updater.log", "tail": bad_tail}, headers=headers
+        )
+        assert rejected.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    missing = client.get("/ui/logs/content", params={"name": "../updater.log"}, headers=headers)
+    assert missing.status_code == HTTPStatus.NOT_FOUND
+
+    for nul_name in ("a\x00.log", "\x00"):
+        nul = client.get("/ui/logs/content", params={"name": nul_name}, headers=headers)
+        assert nul.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_fastapi_ui_log_content_reads_dot_prefixed_listed_log(
+    monkeypatch: pytest.MonkeyPatch,
+    store: ConfigStore,
+    schedule_store: ScheduleStore,
+    tmp_path: Path,
+) -> None:
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("PULLPILOT_TOKEN", "log-dot")
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / ".hidden.log").write_text("oculto\n", encoding="utf-8")
+    config = store.load()
+    config.values["LOG_DIR"] = str(log_dir)
+    monkeypatch.setattr(store, "load", lambda: config)
+
+    client = TestClient(create_app(store=store, schedule_store=schedule_store))
+    headers = {"Authorization": "Bearer log-dot"}
+
+    listing = client.get("/ui/logs", headers=headers)
+    assert listing.status_code == HTTPStatus.OK
+    assert [entry["name"] for entry in listing.json()["files"]] == [".hidden.log"]
+
+    response = client.get("/ui/logs/content", params={"name": ".hidden.log"}, headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == "oculto\n"
+
+
 def test_ui_config_rejected_without_credentials(
     monkeypatch: pytest.MonkeyPatch,
     store: ConfigStore,
@@ -1169,6 +1353,21 @@ def test_ui_logs_reads_compressed_content(
     assert logs["selected"]["content"] == "línea A\nlínea B\n"
 
 
+def test_read_log_tail_returns_last_lines_of_large_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from pullpilot.ui import logs as logs_module
+
+    monkeypatch.setattr(logs_module, "_TAIL_CHUNK_SIZE", 16)
+    log_path = tmp_path / "grande.log"
+    lines = [f"línea {index}\r\n" for index in range(200)]
+    log_path.write_bytes("".join(lines).encode("utf-8") + b"sin salto")
+
+    content = logs_module.read_log_tail(log_path, max_lines=3)
+
+    assert content == "línea 198\nlínea 199\nsin salto"
+
+
 @pytest.mark.skipif(os.name == "nt", reason="POSIX file permissions not supported on Windows")
 def test_gather_logs_handles_unreadable_directory(
     store: ConfigStore,
@@ -1185,14 +1384,14 @@ def test_gather_logs_handles_unreadable_directory(
     config.values["LOG_DIR"] = str(log_dir)
     monkeypatch.setattr(store, "load", lambda: config)
 
-    original_iterdir = Path.iterdir
+    original_scandir = os.scandir
 
-    def fake_iterdir(self: Path):  # type: ignore[override]
-        if self == log_dir:
+    def fake_scandir(path):  # type: ignore[no-untyped-def]
+        if Path(path) == log_dir:
             raise PermissionError(errno.EACCES, os.strerror(errno.EACCES))
-        return original_iterdir(self)
+        return original_scandir(path)
 
-    monkeypatch.setattr(Path, "iterdir", fake_iterdir)
+    monkeypatch.setattr(logs_module.os, "scandir", fake_scandir)
 
     with caplog.at_level("WARNING"):
         payload = logs_module.gather_logs(store)